@@ -0,0 +1 @@
+"""Arcade games collection built with pygame."""
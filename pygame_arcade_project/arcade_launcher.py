@@ -8,7 +8,12 @@ import sys
 import os
 import subprocess
 
+from .utils.helper import wait_for_events, filter_menu_events
+from .utils.fonts import get_sysfont
+from .utils.audio_manager import pre_init_mixer
+
 # Initialize pygame
+pre_init_mixer()
 pygame.init()
 
 # Screen dimensions
@@ -16,22 +21,28 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Directory holding this package; games are started with -m from there
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Game list
 GAMES = [
     {
         "name": "Rocket Rumble",
         "description": "Space shooter with waves of enemies",
         "color": (0, 255, 255),  # Cyan
-        "script": "run_rocket_rumble.py"
+        "module": "run_rocket_rumble"
     },
     {
         "name": "Pixel Heist",
         "description": "Stealth-based heist game",
         "color": (0, 255, 0),  # Green
-        "script": "run_pixel_heist.py"
+        "module": "run_pixel_heist"
     }
 ]
 
+# Button outline color
+BUTTON_BORDER_COLOR = (255, 255, 255)
+
 class Button:
     """A button class with hover effects."""
     
@@ -39,40 +50,66 @@ class Button:
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
+        self._hover_bg = tuple(min(c + 30, 255) for c in color)
         self.description = description
         self.hover = False
-        self.font = pygame.font.SysFont("Arial", 24)
-        self.desc_font = pygame.font.SysFont("Arial", 16)
+        self._last_hover = None  # Hover state last drawn
+        self.font = get_sysfont("Arial", 24)
+        self.desc_font = get_sysfont("Arial", 16)
+        
+        # Render the labels once; they never change
+        self.text_surf = self.font.render(self.text, True, (255, 255, 255))
+        self.text_rect = self.text_surf.get_rect(center=self.rect.center)
+        self.desc_surf = None
+        if self.description:
+            self.desc_surf = self.desc_font.render(self.description, True, (255, 255, 255))
+            self.desc_rect = self.desc_surf.get_rect(midtop=(self.rect.centerx, self.rect.bottom + 5))
+        
+        # Screen area the button can paint, including the hover description
+        self.area = self.rect.union(self.desc_rect) if self.desc_surf else self.rect.copy()
     
     def update(self, mouse_pos):
-        """Update button state."""
-        self.hover = self.rect.collidepoint(mouse_pos)
-        return self.hover
+        """Update button state; return True when the hover state changed."""
+        hover = bool(self.rect.collidepoint(mouse_pos))
+        changed = hover != self.hover
+        self.hover = hover
+        return changed
     
-    def draw(self, surface):
-        """Draw the button."""
+    def draw(self, surface, force=False):
+        """Draw the button if its look changed; return the painted area or None."""
+        if self.hover == self._last_hover and not force:
+            return None
+        self._last_hover = self.hover
+        
         # Draw button background with hover effect
-        color = tuple(min(c + 30, 255) for c in self.color) if self.hover else self.color
+        color = self._hover_bg if self.hover else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, (255, 255, 255), self.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, BUTTON_BORDER_COLOR, self.rect, 2, border_radius=8)
         
         # Draw button text
-        text_surf = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        surface.blit(self.text_surf, self.text_rect)
         
         # Draw description if hovering
-        if self.hover and self.description:
-            desc_surf = self.desc_font.render(self.description, True, (255, 255, 255))
-            desc_rect = desc_surf.get_rect(midtop=(self.rect.centerx, self.rect.bottom + 5))
-            surface.blit(desc_surf, desc_rect)
+        if self.hover and self.desc_surf:
+            surface.blit(self.desc_surf, self.desc_rect)
+        
+        return self.area
+
+def launch_game(game):
+    """Start a game module with the current interpreter and return its process."""
+    print(f"Launching {game['name']}...")
+    return subprocess.Popen(
+        [sys.executable, "-m", f"{__package__}.{game['module']}"],
+        cwd=PACKAGE_PARENT,
+        close_fds=True
+    )
 
 def main():
     """Main function to run the launcher."""
     # Create screen
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Arcade Games Launcher")
-    clock = pygame.time.Clock()
+    filter_menu_events()
     
     # Create buttons
     buttons = []
@@ -100,61 +137,67 @@ def main():
     )
     buttons.append(exit_button)
     
-    # Load fonts
-    title_font = pygame.font.SysFont("Arial", 48)
+    # Load fonts and render the title once
+    title_font = get_sysfont("Arial", 48)
+    title_surf = title_font.render("ARCADE GAMES", True, (255, 255, 255))
+    title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
     
-    # Main loop
+    # Main loop: the menu is static, so sleep until input arrives and only
+    # redraw when something on screen changed
     running = True
+    needs_redraw = True
+    background = None  # Screen without buttons, captured on each full redraw
+    mouse_pos = pygame.mouse.get_pos()  # Kept current from MOUSEMOTION events
+    game_process = None  # Handle of the running game, if any
     while running:
-        # Handle events
-        for event in pygame.event.get():
+        # Handle the waiting events in one batch
+        for event in wait_for_events():
             if event.type == pygame.QUIT:
                 running = False
             
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                needs_redraw = True
+            
+            elif event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+            
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = event.pos
                     for i, button in enumerate(buttons):
                         if button.rect.collidepoint(mouse_pos):
                             if i == len(buttons) - 1:  # Exit button
                                 running = False
                             else:
-                                # Launch the selected game using subprocess
-                                game = GAMES[i]
-                                script_path = os.path.join(
-                                    os.path.dirname(os.path.abspath(__file__)),
-                                    game["script"]
-                                )
-                                print(f"Launching {game['name']}...")
-                                
-                                # Use subprocess to run the game in a separate process
-                                pygame.quit()  # Quit pygame before launching
-                                subprocess.call(["python3", script_path])
-                                
-                                # Reinitialize pygame after game exits
-                                pygame.init()
-                                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                                pygame.display.set_caption("Arcade Games Launcher")
-        
-        # Update buttons
-        mouse_pos = pygame.mouse.get_pos()
-        for button in buttons:
-            button.update(mouse_pos)
+                                # Start the game in its own process unless one is still running;
+                                # the launcher keeps pumping events meanwhile
+                                if game_process is None or game_process.poll() is not None:
+                                    game_process = launch_game(GAMES[i])
         
-        # Draw
-        screen.fill((20, 20, 40))
+        # Update buttons and collect the ones whose hover state changed
+        changed = [button for button in buttons if button.update(mouse_pos)]
         
-        # Draw title
-        title_surf = title_font.render("ARCADE GAMES", True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        screen.blit(title_surf, title_rect)
-        
-        # Draw buttons
-        for button in buttons:
-            button.draw(screen)
+        if needs_redraw:
+            needs_redraw = False
+            
+            # Draw background and title, keeping a copy for partial repaints
+            screen.fill((20, 20, 40))
+            screen.blit(title_surf, title_rect)
+            background = screen.copy()
+            
+            # Draw buttons
+            for button in buttons:
+                button.draw(screen, force=True)
+            
+            pygame.display.flip()
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        elif changed:
+            # Repaint just the changed buttons and present only their areas
+            dirty_rects = []
+            for button in changed:
+                screen.blit(background, button.area, button.area)
+                dirty_rects.append(button.draw(screen))
+            pygame.display.update(dirty_rects)
     
     pygame.quit()
     sys.exit()
@@ -9,6 +9,12 @@ SCREEN_HEIGHT = 600
 # Game settings
 FPS = 60
 
+# Mixer settings; raise MIXER_BUFFER on devices that crackle
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
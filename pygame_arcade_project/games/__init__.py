@@ -0,0 +1 @@
+"""Games playable from the arcade launchers."""
@@ -4,15 +4,11 @@ A top-down stealth heist game.
 """
 
 import pygame
-import sys
-import os
 import math
 import random
 from enum import Enum
 
-# Add parent directory to path to import from utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from ...config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 
 class GameState(Enum):
     """Game state enumeration."""
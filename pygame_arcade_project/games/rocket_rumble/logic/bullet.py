@@ -4,8 +4,13 @@ Bullet and projectile classes for Rocket Rumble game.
 
 import pygame
 import math
+from collections import deque
 from enum import Enum
 
+# Missile homing works in radians to avoid degree conversions per frame
+_TURN_RATE_RAD = math.radians(180)
+_TWO_PI = 2 * math.pi
+
 class ProjectileType(Enum):
     """Types of projectiles in the game."""
     LASER = 1
@@ -16,7 +21,7 @@ class ProjectileType(Enum):
 class Projectile(pygame.sprite.Sprite):
     """Base class for all projectiles."""
     
-    def __init__(self, x, y, angle, speed, damage, color, size=4):
+    def __init__(self, x, y, angle, speed, damage, color, size=4, trail_length=10):
         super().__init__()
         
         # Create the projectile image
@@ -36,8 +41,8 @@ class Projectile(pygame.sprite.Sprite):
         self.timer = 0
         
         # Trail effect
-        self.trail = []
-        self.max_trail_length = 10
+        self.max_trail_length = trail_length
+        self.trail = deque(maxlen=trail_length)
     
     def update(self, dt, arena_rect):
         """Update projectile position and lifetime."""
@@ -54,10 +59,8 @@ class Projectile(pygame.sprite.Sprite):
         if not arena_rect.colliderect(self.rect):
             self.kill()
         
-        # Update trail
+        # Update trail (deque drops the oldest point automatically)
         self.trail.append(self.position.copy())
-        if len(self.trail) > self.max_trail_length:
-            self.trail.pop(0)
     
     def draw(self, surface):
         """Draw the projectile and its trail."""
@@ -83,10 +86,10 @@ class Laser(Projectile):
             speed=600,  # Pixels per second
             damage=damage,
             color=(255, 0, 0),  # Red
-            size=4
+            size=4,
+            trail_length=5
         )
         self.lifetime = 1.0
-        self.max_trail_length = 5
 
 class Missile(Projectile):
     """Homing missile projectile."""
@@ -97,11 +100,11 @@ class Missile(Projectile):
             speed=300,  # Slower than laser
             damage=damage * 2,  # Double damage
             color=(255, 165, 0),  # Orange
-            size=6
+            size=6,
+            trail_length=15
         )
         self.lifetime = 3.0
-        self.max_trail_length = 15
-        self.turn_rate = 180  # Degrees per second
+        self.turn_rate = _TURN_RATE_RAD  # Radians per second
         self.target = None
         self.max_tracking_distance = 400
     
@@ -110,13 +113,17 @@ class Missile(Projectile):
         if self.target:
             # Calculate angle to target
             to_target = self.target.position - self.position
-            target_angle = math.degrees(math.atan2(-to_target.y, to_target.x))
+            target_angle = math.atan2(-to_target.y, to_target.x)
             
             # Calculate current angle
-            current_angle = math.degrees(math.atan2(-self.velocity.y, self.velocity.x))
+            current_angle = math.atan2(-self.velocity.y, self.velocity.x)
             
             # Calculate angle difference
-            angle_diff = (target_angle - current_angle + 180) % 360 - 180
+            angle_diff = target_angle - current_angle
+            if angle_diff > math.pi:
+                angle_diff -= _TWO_PI
+            elif angle_diff < -math.pi:
+                angle_diff += _TWO_PI
             
             # Turn towards target
             turn_amount = min(abs(angle_diff), self.turn_rate * dt)
@@ -125,7 +132,7 @@ class Missile(Projectile):
             
             # Update velocity direction
             speed = self.velocity.length()
-            angle = math.radians(current_angle + turn_amount)
+            angle = current_angle + turn_amount
             self.velocity.x = math.cos(angle) * speed
             self.velocity.y = -math.sin(angle) * speed
             
@@ -148,10 +155,10 @@ class Plasma(Projectile):
             speed=400,
             damage=damage * 1.5,
             color=(0, 255, 255),  # Cyan
-            size=8
+            size=8,
+            trail_length=8
         )
         self.lifetime = 1.5
-        self.max_trail_length = 8
         self.pulse_timer = 0
         self.pulse_rate = 0.1  # Seconds per pulse
     
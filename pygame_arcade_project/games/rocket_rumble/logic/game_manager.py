@@ -12,6 +12,10 @@ from .ship import Ship, ShipType
 from .bullet import Laser, Missile, Plasma, EMP
 from .powerups import PowerUpManager, PowerUpType
 
+def _wrap180(d):
+    """Wrap an angle difference in degrees into the [-180, 180] range."""
+    return d - 360.0 if d > 180.0 else (d + 360.0 if d < -180.0 else d)
+
 class GameMode(Enum):
     """Game modes available."""
     FREE_FOR_ALL = 1
@@ -49,6 +53,8 @@ class GameManager:
         # Player and enemies
         self.player_ship = None
         self.enemy_ships = []
+        self.player_alive = False
+        self.enemies_alive = 0
         
         # Power-ups
         self.powerup_manager = PowerUpManager(self.arena_rect)
@@ -101,6 +107,10 @@ class GameManager:
             self.all_sprites.add(enemy)
             self.scores[enemy] = 0
         
+        # Track survivors so end checks don't scan every ship each frame
+        self.player_alive = True
+        self.enemies_alive = len(self.enemy_ships)
+        
         # Initialize power-ups
         self.powerup_manager = PowerUpManager(self.arena_rect)
         
@@ -122,14 +132,15 @@ class GameManager:
         for sprite in self.all_sprites:
             sprite.update(dt, self.arena_rect)
         
-        # Update power-ups
-        self.powerup_manager.update(dt)
+        # Update power-ups against a single clock read for this frame
+        now = pygame.time.get_ticks()
+        self.powerup_manager.update(dt, now)
         
         # Update AI
         self.ai_timer += dt
         if self.ai_timer >= self.ai_update_interval:
             self.ai_timer = 0
-            self.update_ai()
+            self.update_ai(dt)
         
         # Check collisions
         self.check_collisions()
@@ -137,7 +148,7 @@ class GameManager:
         # Check game end conditions
         self.check_game_end()
     
-    def update_ai(self):
+    def update_ai(self, dt):
         """Update AI-controlled ships."""
         for enemy in self.enemy_ships:
             if not enemy.alive():
@@ -147,52 +158,17 @@ class GameManager:
             target = self.player_ship
             
             if target and target.alive():
-                # Calculate vector to target
-                to_target = target.position - enemy.position
-                distance = to_target.length()
-                
-                # Determine behavior based on distance
-                if distance > 300:
-                    # Move towards target
-                    angle_to_target = math.degrees(math.atan2(-to_target.y, to_target.x))
-                    
-                    # Rotate towards target
-                    angle_diff = (angle_to_target - enemy.angle + 180) % 360 - 180
-                    if angle_diff > 10:
-                        enemy.rotate(-1)
-                    elif angle_diff < -10:
-                        enemy.rotate(1)
-                    else:
-                        # Apply thrust if facing target
-                        enemy.thrust(1)
-                
-                elif distance < 150:
-                    # Too close, back away
-                    angle_from_target = (math.degrees(math.atan2(-to_target.y, to_target.x)) + 180) % 360
-                    
-                    # Rotate away from target
-                    angle_diff = (angle_from_target - enemy.angle + 180) % 360 - 180
-                    if angle_diff > 10:
-                        enemy.rotate(-1)
-                    elif angle_diff < -10:
-                        enemy.rotate(1)
-                    else:
-                        # Apply thrust if facing away
-                        enemy.thrust(1)
+                # Reuse the last steering command while neither ship has moved
+                command = enemy.get_ai_command(target.position)
+                if command is None:
+                    command = self.steer_towards(enemy, target)
+                    enemy.set_ai_command(command, target.position)
+                rotate_dir, thrust_amount = command
                 
-                else:
-                    # Good combat distance, orbit and attack
-                    orbit_angle = math.degrees(math.atan2(-to_target.y, to_target.x)) + 90
-                    
-                    # Rotate to orbit position
-                    angle_diff = (orbit_angle - enemy.angle + 180) % 360 - 180
-                    if angle_diff > 10:
-                        enemy.rotate(-1)
-                    elif angle_diff < -10:
-                        enemy.rotate(1)
-                    
-                    # Apply some thrust
-                    enemy.thrust(0.5)
+                if rotate_dir:
+                    enemy.rotate(rotate_dir, dt)
+                if thrust_amount:
+                    enemy.thrust(thrust_amount)
                 
                 # Fire weapons based on difficulty
                 if self.difficulty == Difficulty.EASY:
@@ -230,6 +206,48 @@ class GameManager:
                         elif ability == 'emp' and enemy.fire_emp():
                             self.fire_emp(enemy)
     
+    def steer_towards(self, enemy, target):
+        """Decide an AI ship's (rotate direction, thrust amount) towards a target."""
+        # Calculate vector to target
+        to_target = target.position - enemy.position
+        distance = to_target.length()
+        
+        # Determine behavior based on distance
+        if distance > 300:
+            # Move towards target
+            angle_to_target = math.degrees(math.atan2(-to_target.y, to_target.x))
+            
+            # Rotate towards target, apply thrust if facing target
+            angle_diff = _wrap180(angle_to_target - enemy.angle)
+            if angle_diff > 10:
+                return -1, 0
+            elif angle_diff < -10:
+                return 1, 0
+            return 0, 1
+        
+        elif distance < 150:
+            # Too close, back away
+            angle_from_target = math.degrees(math.atan2(-to_target.y, to_target.x)) + 180
+            
+            # Rotate away from target, apply thrust if facing away
+            angle_diff = _wrap180(angle_from_target - enemy.angle)
+            if angle_diff > 10:
+                return -1, 0
+            elif angle_diff < -10:
+                return 1, 0
+            return 0, 1
+        
+        # Good combat distance, orbit and attack
+        orbit_angle = math.degrees(math.atan2(-to_target.y, to_target.x)) + 90
+        
+        # Rotate to orbit position and apply some thrust
+        angle_diff = _wrap180(orbit_angle - enemy.angle)
+        if angle_diff > 10:
+            return -1, 0.5
+        elif angle_diff < -10:
+            return 1, 0.5
+        return 0, 0.5
+    
     def fire_weapon(self, ship):
         """Fire ship's primary weapon."""
         if ship.fire_primary():
@@ -273,9 +291,18 @@ class GameManager:
     
     def check_collisions(self):
         """Check for collisions between game objects."""
-        # Check projectile hits on ships
+        # Check projectile hits on ships, building the rect list once per frame
+        projectiles = self.projectiles.sprites()
+        projectile_rects = [projectile.rect for projectile in projectiles]
         for ship in self.ships:
-            hits = pygame.sprite.spritecollide(ship, self.projectiles, True)
+            # Skip projectiles already consumed by another ship this frame
+            hits = [projectiles[index] for index in ship.rect.collidelistall(projectile_rects)
+                    if projectiles[index].alive()]
+            
+            # Every overlapping projectile is spent, even past the killing blow
+            for projectile in hits:
+                projectile.kill()
+            
             for projectile in hits:
                 if isinstance(projectile, EMP):
                     # EMP effect: Disable abilities temporarily
@@ -289,12 +316,15 @@ class GameManager:
                         # Award points to the shooter
                         if ship != self.player_ship:
                             self.scores[self.player_ship] += 100
+                            self.enemies_alive -= 1
                         else:
                             # Player was destroyed by enemy
                             for enemy in self.enemy_ships:
                                 self.scores[enemy] += 50
+                            self.player_alive = False
                         
                         ship.kill()
+                        break
         
         # Check power-up collection
         for ship in self.ships:
@@ -306,13 +336,13 @@ class GameManager:
     def check_game_end(self):
         """Check if game end conditions are met."""
         # Check if player is destroyed
-        if not self.player_ship.alive():
+        if not self.player_alive:
             self.game_over = True
             self.victory = False
             return
         
         # Check if all enemies are destroyed
-        if all(not enemy.alive() for enemy in self.enemy_ships):
+        if self.enemies_alive == 0:
             self.game_over = True
             self.victory = True
             return
@@ -80,7 +80,7 @@ class MultiplayerManager:
         if player_id in PlayerID and player_id.value <= self.active_players:
             self.player_ships[player_id] = ship
     
-    def handle_input(self, keys, game_manager):
+    def handle_input(self, keys, game_manager, dt):
         """Handle input for all active players."""
         for player_id, ship in self.player_ships.items():
             if not ship or not ship.alive():
@@ -90,9 +90,9 @@ class MultiplayerManager:
             
             # Rotation
             if keys[controls['left']]:
-                ship.rotate(1)  # Rotate left
+                ship.rotate(1, dt)  # Rotate left
             if keys[controls['right']]:
-                ship.rotate(-1)  # Rotate right
+                ship.rotate(-1, dt)  # Rotate right
             
             # Thrust
             if keys[controls['up']]:
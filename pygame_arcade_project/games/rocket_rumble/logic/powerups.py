@@ -5,8 +5,35 @@ Power-up system for Rocket Rumble game.
 import pygame
 import random
 import math
+from collections import defaultdict, namedtuple
 from enum import Enum
 
+from ....utils.trig import SIN, LUT_SIZE, LUT_MASK
+from ....utils.helper import convert_alpha
+
+# Hover bob: sin(ticks * 0.003) expressed as a sine-table index
+_HOVER_LUT_SCALE = 0.003 * LUT_SIZE / (2 * math.pi)
+
+# Effect ids for timed power-ups, dispatched through _EFFECTS on expiry
+EFFECT_NONE, EFFECT_SHIELD_END, EFFECT_SPEED_END = 0, 1, 2
+
+def _end_nothing(ship, ctx):
+    """Effects handled elsewhere (e.g. by the game manager)."""
+
+def _end_shield(ship, ctx):
+    """Turn off a power-up shield."""
+    ship.abilities['shield']['active'] = False
+
+def _end_speed(ship, ctx):
+    """Restore the ship's speed from before the boost."""
+    ship.speed = ctx['original_speed']
+
+_EFFECTS = (_end_nothing, _end_shield, _end_speed)
+
+def end_effect(ship, effect):
+    """Undo a timed power-up effect returned by PowerUp.apply."""
+    _EFFECTS[effect['effect_id']](ship, effect['ctx'])
+
 class PowerUpType(Enum):
     """Types of power-ups available in the game."""
     HEALTH = 1
@@ -15,43 +42,61 @@ class PowerUpType(Enum):
     MULTI_SHOT = 4
     INVINCIBILITY = 5
 
+# Icon outlines for the 20px power-up sprite
+_BOLT_POINTS_20 = ((10, 5), (6, 10), (10, 10), (10, 15), (13, 10), (10, 10))
+_STAR_POINTS_20 = (
+    (10, 4), (9, 8), (5, 9), (8, 10), (7, 14),
+    (10, 13), (13, 14), (12, 10), (15, 9), (11, 8)
+)
+
+# Immutable per-type settings; attribute access avoids string-key lookups
+PowerUpConfig = namedtuple('PowerUpConfig', ['color', 'duration', 'value', 'name'])
+
 class PowerUp(pygame.sprite.Sprite):
     """Power-up item that can be collected by ships."""
     
     # Power-up configurations
     POWERUP_CONFIGS = {
-        PowerUpType.HEALTH: {
-            'color': (0, 255, 0),  # Green
-            'duration': 0,  # Instant effect
-            'value': 50,  # Health points
-            'name': 'Health'
-        },
-        PowerUpType.SHIELD: {
-            'color': (0, 255, 255),  # Cyan
-            'duration': 10.0,  # Seconds
-            'value': 100,  # Shield points
-            'name': 'Shield'
-        },
-        PowerUpType.SPEED: {
-            'color': (255, 255, 0),  # Yellow
-            'duration': 5.0,  # Seconds
-            'value': 1.5,  # Speed multiplier
-            'name': 'Speed Boost'
-        },
-        PowerUpType.MULTI_SHOT: {
-            'color': (255, 0, 255),  # Magenta
-            'duration': 8.0,  # Seconds
-            'value': 3,  # Number of shots
-            'name': 'Multi-Shot'
-        },
-        PowerUpType.INVINCIBILITY: {
-            'color': (255, 165, 0),  # Orange
-            'duration': 3.0,  # Seconds
-            'value': 0,  # No specific value
-            'name': 'Invincibility'
-        }
+        PowerUpType.HEALTH: PowerUpConfig(
+            color=(0, 255, 0),  # Green
+            duration=0,  # Instant effect
+            value=50,  # Health points
+            name='Health'
+        ),
+        PowerUpType.SHIELD: PowerUpConfig(
+            color=(0, 255, 255),  # Cyan
+            duration=10.0,  # Seconds
+            value=100,  # Shield points
+            name='Shield'
+        ),
+        PowerUpType.SPEED: PowerUpConfig(
+            color=(255, 255, 0),  # Yellow
+            duration=5.0,  # Seconds
+            value=1.5,  # Speed multiplier
+            name='Speed Boost'
+        ),
+        PowerUpType.MULTI_SHOT: PowerUpConfig(
+            color=(255, 0, 255),  # Magenta
+            duration=8.0,  # Seconds
+            value=3,  # Number of shots
+            name='Multi-Shot'
+        ),
+        PowerUpType.INVINCIBILITY: PowerUpConfig(
+            color=(255, 165, 0),  # Orange
+            duration=3.0,  # Seconds
+            value=0,  # No specific value
+            name='Invincibility'
+        )
     }
     
+    # Pre-rendered animation frames, shared by all power-ups of a type
+    ANGLE_STEP = 10  # Degrees between rotation frames
+    PULSE_SCALES = (0.8, 0.9, 1.0, 1.1, 1.2)
+    PULSE_STEP = 0.1
+    PICKUP_RADIUS = 12  # Fits the power-up at its largest pulse
+    _sprite_cache = {}
+    _frame_cache = {}
+    
     def __init__(self, x, y, powerup_type=None):
         super().__init__()
         
@@ -62,17 +107,23 @@ class PowerUp(pygame.sprite.Sprite):
         self.type = powerup_type
         self.config = self.POWERUP_CONFIGS[powerup_type]
         
-        # Create power-up image
+        # Power-up image and rotation/pulse frame table, drawn once per type
         self.size = 20
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.original_image = self.image.copy()
-        
-        # Draw power-up
-        self.draw_powerup()
+        self.original_image = PowerUp._sprite_cache.get(powerup_type)
+        if self.original_image is None:
+            self.original_image = self._build_and_cache()
+        self.frames = PowerUp._frame_cache[powerup_type]
         
         # Position and movement
-        self.rect = self.image.get_rect()
         self.position = pygame.math.Vector2(x, y)
+        self.hover_speed = 2
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Place the power-up at (x, y) and restart its animation."""
+        self.image = self.original_image
+        self.rect = self.image.get_rect()
+        self.position.update(x, y)
         self.rect.center = self.position
         
         # Animation
@@ -80,7 +131,6 @@ class PowerUp(pygame.sprite.Sprite):
         self.pulse_scale = 1.0
         self.pulse_direction = 0.1
         self.hover_offset = 0
-        self.hover_speed = 2
         self.original_y = y
     
     def draw_powerup(self):
@@ -91,7 +141,7 @@ class PowerUp(pygame.sprite.Sprite):
         # Draw outer circle
         pygame.draw.circle(
             self.image,
-            self.config['color'],
+            self.config.color,
             (self.size // 2, self.size // 2),
             self.size // 2,
             2
@@ -102,12 +152,12 @@ class PowerUp(pygame.sprite.Sprite):
             # Draw plus sign
             pygame.draw.rect(
                 self.image,
-                self.config['color'],
+                self.config.color,
                 (self.size // 2 - 2, self.size // 4, 4, self.size // 2)
             )
             pygame.draw.rect(
                 self.image,
-                self.config['color'],
+                self.config.color,
                 (self.size // 4, self.size // 2 - 2, self.size // 2, 4)
             )
         
@@ -115,7 +165,7 @@ class PowerUp(pygame.sprite.Sprite):
             # Draw shield shape
             pygame.draw.circle(
                 self.image,
-                self.config['color'],
+                self.config.color,
                 (self.size // 2, self.size // 2),
                 self.size // 3,
                 1
@@ -123,19 +173,11 @@ class PowerUp(pygame.sprite.Sprite):
         
         elif self.type == PowerUpType.SPEED:
             # Draw lightning bolt
-            points = [
-                (self.size // 2, self.size // 4),
-                (self.size // 3, self.size // 2),
-                (self.size // 2, self.size // 2),
-                (self.size // 2, 3 * self.size // 4),
-                (2 * self.size // 3, self.size // 2),
-                (self.size // 2, self.size // 2)
-            ]
             pygame.draw.lines(
                 self.image,
-                self.config['color'],
+                self.config.color,
                 False,
-                points,
+                _BOLT_POINTS_20,
                 2
             )
         
@@ -143,54 +185,67 @@ class PowerUp(pygame.sprite.Sprite):
             # Draw three dots
             pygame.draw.circle(
                 self.image,
-                self.config['color'],
+                self.config.color,
                 (self.size // 2, self.size // 2),
                 2
             )
             pygame.draw.circle(
                 self.image,
-                self.config['color'],
+                self.config.color,
                 (self.size // 3, self.size // 2),
                 2
             )
             pygame.draw.circle(
                 self.image,
-                self.config['color'],
+                self.config.color,
                 (2 * self.size // 3, self.size // 2),
                 2
             )
         
         elif self.type == PowerUpType.INVINCIBILITY:
             # Draw star shape
-            points = []
-            for i in range(5):
-                angle = math.pi / 2 + i * 2 * math.pi / 5
-                points.append((
-                    self.size // 2 + int(self.size // 3 * math.cos(angle)),
-                    self.size // 2 - int(self.size // 3 * math.sin(angle))
-                ))
-                angle += math.pi / 5
-                points.append((
-                    self.size // 2 + int(self.size // 6 * math.cos(angle)),
-                    self.size // 2 - int(self.size // 6 * math.sin(angle))
-                ))
-            
             pygame.draw.polygon(
                 self.image,
-                self.config['color'],
-                points,
+                self.config.color,
+                _STAR_POINTS_20,
                 1
             )
         
         # Store original image for rotation
         self.original_image = self.image.copy()
     
-    def update(self, dt):
-        """Update power-up animation."""
+    def _build_and_cache(self):
+        """Draw this power-up type and cache its sprite and frame table."""
+        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        self.draw_powerup()
+        self.original_image = convert_alpha(self.original_image)
+        
+        PowerUp._sprite_cache[self.type] = self.original_image
+        PowerUp._frame_cache[self.type] = self.build_frames()
+        return self.original_image
+    
+    def build_frames(self):
+        """Pre-render every rotation step at every pulse scale.
+        
+        Returns a table indexed as frames[angle_index][scale_index].
+        """
+        # rotozoom rotates and scales in a single resampling pass
+        return [
+            [
+                pygame.transform.rotozoom(self.original_image, angle, scale)
+                for scale in self.PULSE_SCALES
+            ]
+            for angle in range(0, 360, self.ANGLE_STEP)
+        ]
+    
+    def update(self, dt, hover_offset):
+        """Update power-up animation.
+        
+        hover_offset is the shared vertical bob for this frame, computed
+        once by PowerUpManager.
+        """
         # Rotate
         self.angle = (self.angle + 60 * dt) % 360
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
         
         # Pulse size
         self.pulse_scale += self.pulse_direction * dt
@@ -201,59 +256,62 @@ class PowerUp(pygame.sprite.Sprite):
             self.pulse_scale = 0.8
             self.pulse_direction = 0.1
         
-        scaled_size = int(self.size * self.pulse_scale)
-        self.image = pygame.transform.scale(
-            self.image,
-            (scaled_size, scaled_size)
-        )
+        # Look up the pre-rendered frame instead of resampling
+        angle_index = int(self.angle // self.ANGLE_STEP) % len(self.frames)
+        scale_index = round((self.pulse_scale - self.PULSE_SCALES[0]) / self.PULSE_STEP)
+        self.image = self.frames[angle_index][scale_index]
         self.rect = self.image.get_rect(center=self.rect.center)
         
         # Hover effect
-        self.hover_offset = math.sin(pygame.time.get_ticks() * 0.003) * 3
+        self.hover_offset = hover_offset
         self.position.y = self.original_y + self.hover_offset
         self.rect.center = self.position
     
     def apply(self, ship):
         """Apply power-up effect to a ship."""
         if self.type == PowerUpType.HEALTH:
-            ship.heal(self.config['value'])
+            ship.heal(self.config.value)
             return None  # No active effect
         
         elif self.type == PowerUpType.SHIELD:
-            ship.shield = self.config['value']
+            ship.shield = self.config.value
             ship.abilities['shield']['active'] = True
             return {
                 'type': self.type,
-                'duration': self.config['duration'],
+                'duration': self.config.duration,
                 'timer': 0,
-                'effect': lambda s: setattr(s.abilities['shield'], 'active', False)
+                'effect_id': EFFECT_SHIELD_END,
+                'ctx': None
             }
         
         elif self.type == PowerUpType.SPEED:
             original_speed = ship.speed
-            ship.speed *= self.config['value']
+            ship.speed *= self.config.value
             return {
                 'type': self.type,
-                'duration': self.config['duration'],
+                'duration': self.config.duration,
                 'timer': 0,
-                'effect': lambda s: setattr(s, 'speed', original_speed)
+                'effect_id': EFFECT_SPEED_END,
+                'ctx': {'original_speed': original_speed}
             }
         
         elif self.type == PowerUpType.MULTI_SHOT:
             return {
                 'type': self.type,
-                'duration': self.config['duration'],
+                'duration': self.config.duration,
                 'timer': 0,
-                'value': self.config['value'],
-                'effect': lambda s: None  # Handled in game manager
+                'value': self.config.value,
+                'effect_id': EFFECT_NONE,  # Handled in game manager
+                'ctx': None
             }
         
         elif self.type == PowerUpType.INVINCIBILITY:
             return {
                 'type': self.type,
-                'duration': self.config['duration'],
+                'duration': self.config.duration,
                 'timer': 0,
-                'effect': lambda s: None  # Handled in game manager
+                'effect_id': EFFECT_NONE,  # Handled in game manager
+                'ctx': None
             }
 
 class PowerUpManager:
@@ -262,15 +320,25 @@ class PowerUpManager:
     def __init__(self, arena_rect):
         self.arena_rect = arena_rect
         self.powerups = pygame.sprite.Group()
+        self._powerup_list = []  # Same members as self.powerups, cheaper to iterate
         self.spawn_timer = 0
         self.spawn_interval = 10.0  # Seconds between spawns
         self.max_powerups = 5
+        
+        # Collected power-ups kept for reuse, keyed by type
+        self._pool = defaultdict(list)
     
-    def update(self, dt):
-        """Update power-ups and spawn new ones."""
+    def update(self, dt, now):
+        """Update power-ups and spawn new ones.
+        
+        now is the frame's pygame.time.get_ticks() value, read once by the caller.
+        """
+        # Hover bob only depends on time, so compute it once for all power-ups
+        hover_offset = round(SIN[int(now * _HOVER_LUT_SCALE) & LUT_MASK] * 3)
+        
         # Update existing power-ups
-        for powerup in self.powerups:
-            powerup.update(dt)
+        for powerup in self._powerup_list:
+            powerup.update(dt, hover_offset)
         
         # Spawn new power-ups
         self.spawn_timer += dt
@@ -288,16 +356,39 @@ class PowerUpManager:
         else:
             x, y = position
         
-        powerup = PowerUp(x, y, powerup_type)
+        if powerup_type is None:
+            powerup_type = random.choice(list(PowerUpType))
+        
+        # Recycle a collected power-up of this type if one is available
+        pool = self._pool[powerup_type]
+        if pool:
+            powerup = pool.pop()
+            powerup.reset(x, y)
+        else:
+            powerup = PowerUp(x, y, powerup_type)
         self.powerups.add(powerup)
+        self._powerup_list.append(powerup)
         return powerup
     
     def check_collection(self, ship):
         """Check if ship collects any power-ups."""
-        collected = pygame.sprite.spritecollide(ship, self.powerups, True)
+        # Circle test on positions, independent of the pulsing rect size
+        pickup_distance = ship.rect.width * 0.5 + PowerUp.PICKUP_RADIUS
+        pickup_distance_sq = pickup_distance * pickup_distance
+        ship_x = ship.position.x
+        ship_y = ship.position.y
+        collected = []
+        for powerup in self._powerup_list:
+            dx = powerup.position.x - ship_x
+            dy = powerup.position.y - ship_y
+            if dx * dx + dy * dy < pickup_distance_sq:
+                collected.append(powerup)
         
         active_effects = []
         for powerup in collected:
+            self.powerups.remove(powerup)
+            self._powerup_list.remove(powerup)
+            self._pool[powerup.type].append(powerup)
             effect = powerup.apply(ship)
             if effect:
                 active_effects.append(effect)
@@ -306,5 +397,7 @@ class PowerUpManager:
     
     def draw(self, surface):
         """Draw all power-ups."""
-        for powerup in self.powerups:
-            surface.blit(powerup.image, powerup.rect)
+        surface.blits(
+            [(powerup.image, powerup.rect) for powerup in self._powerup_list],
+            doreturn=False
+        )
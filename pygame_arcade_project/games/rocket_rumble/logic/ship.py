@@ -7,6 +7,24 @@ import pygame
 import math
 from enum import Enum
 
+from ....utils.trig import cos_sin
+from ....utils.helper import convert_alpha
+
+def _update_kinematics(x, y, vx, vy, ax, ay, dt, width, height, drag=0.98):
+    """Integrate one ship step on plain floats.
+    
+    Returns the new (x, y, vx, vy), with the position clamped to the arena.
+    """
+    x += vx * dt
+    y += vy * dt
+    vx = (vx + ax * dt) * drag
+    vy = (vy + ay * dt) * drag
+    
+    # Keep in arena bounds
+    x = max(0, min(width, x))
+    y = max(0, min(height, y))
+    return x, y, vx, vy
+
 class ShipType(Enum):
     """Types of ships available in the game."""
     SPEEDSTER = 1  # Fast but fragile
@@ -14,6 +32,58 @@ class ShipType(Enum):
     SNIPER = 3    # Long-range but low fire rate
     BALANCED = 4  # All-rounder
 
+class ParticleBuffer:
+    """Particles sharing one lifetime, color and size, stored as parallel lists."""
+    
+    def __init__(self, lifetime, color, radius):
+        self.lifetime = lifetime
+        self.color = color
+        self.radius = radius
+        
+        self.xs = []
+        self.ys = []
+        self.vxs = []
+        self.vys = []
+        self.timers = []
+    
+    def __len__(self):
+        return len(self.timers)
+    
+    def add(self, x, y, vx, vy):
+        """Spawn a particle at (x, y) moving (vx, vy) pixels per frame."""
+        self.xs.append(x)
+        self.ys.append(y)
+        self.vxs.append(vx)
+        self.vys.append(vy)
+        self.timers.append(0)
+    
+    def update(self, dt):
+        """Age all particles, drop expired ones and move the rest."""
+        timers = [timer + dt for timer in self.timers]
+        
+        # Every particle shares a lifetime, so expired ones are always oldest
+        expired = 0
+        for timer in timers:
+            if timer < self.lifetime:
+                break
+            expired += 1
+        if expired:
+            del timers[:expired]
+            del self.xs[:expired], self.ys[:expired]
+            del self.vxs[:expired], self.vys[:expired]
+        
+        self.timers = timers
+        self.xs = [x + vx for x, vx in zip(self.xs, self.vxs)]
+        self.ys = [y + vy for y, vy in zip(self.ys, self.vys)]
+    
+    def draw(self, surface):
+        """Draw particles, fading out over their lifetime."""
+        r, g, b = self.color
+        inv_lifetime = 1 / self.lifetime
+        for x, y, timer in zip(self.xs, self.ys, self.timers):
+            alpha = int(255 * (1 - timer * inv_lifetime))
+            pygame.draw.circle(surface, (r, g, b, alpha), (x, y), self.radius)
+
 class Ship(pygame.sprite.Sprite):
     """Player ship class."""
     
@@ -53,6 +123,11 @@ class Ship(pygame.sprite.Sprite):
         }
     }
     
+    ROTATION_STEP = 5  # Degrees between pre-rotated frames
+    SHIELD_ALPHA_STEP = 8  # Alpha quantization for cached shield overlays
+    AI_REPLAN_DIST_SQ = 4  # Squared move of either ship that invalidates a cached AI command
+    _shield_cache = {}
+    
     def __init__(self, x, y, ship_type=ShipType.BALANCED, sprite_sheet=None):
         super().__init__()
         
@@ -96,9 +171,27 @@ class Ship(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
+        # Pre-rotated frames, one per ROTATION_STEP degrees
+        self._rot_frames = [
+            pygame.transform.rotate(self.original_image, -angle)
+            for angle in range(0, 360, self.ROTATION_STEP)
+        ]
+        self._rot_rects = [frame.get_rect() for frame in self._rot_frames]
+        self._rot_index = None
+        self._rot_angle = None
+        
+        # Shield ring fits the widest rotation so its size stays constant
+        self.shield_radius = max(max(rect.size) for rect in self._rot_rects)
+        
+        # Last AI steering command and the state it was decided from
+        self.ai_command = None
+        self.ai_command_pos = None
+        self.ai_command_angle = None
+        self.ai_target_pos = None
+        
         # Particle effects
-        self.thrust_particles = []
-        self.boost_particles = []
+        self.thrust_particles = ParticleBuffer(0.5, (255, 165, 0), 2)  # Orange
+        self.boost_particles = ParticleBuffer(0.8, (0, 255, 255), 3)  # Cyan
         
         # Cooldowns and abilities
         self.abilities = {
@@ -120,6 +213,10 @@ class Ship(pygame.sprite.Sprite):
                 'timer': 0
             }
         }
+        
+        # Fixed views of the ability dicts for the per-frame update
+        self._ability_list = tuple(self.abilities.values())
+        self._shield_ability = self.abilities['shield']
     
     def create_default_ship(self):
         """Create a default ship sprite."""
@@ -141,28 +238,34 @@ class Ship(pygame.sprite.Sprite):
             (0, 3*size//4)             # Bottom
         ]
         pygame.draw.polygon(self.image, (255, 165, 0), glow_points)  # Orange glow
+        
+        # Match the display format so blits skip per-pixel conversion
+        self.image = convert_alpha(self.image)
     
     def update(self, dt, arena_rect):
         """Update ship state."""
-        # Update position
-        self.position += self.velocity * dt
-        self.velocity += self.acceleration * dt
-        
-        # Apply drag
-        drag = 0.98
-        self.velocity *= drag
+        # Update position and velocity
+        x, y, vx, vy = _update_kinematics(
+            self.position.x, self.position.y,
+            self.velocity.x, self.velocity.y,
+            self.acceleration.x, self.acceleration.y,
+            dt, arena_rect.width, arena_rect.height
+        )
+        self.position.update(x, y)
+        self.velocity.update(vx, vy)
         
-        # Keep in arena bounds
-        self.position.x = max(0, min(arena_rect.width, self.position.x))
-        self.position.y = max(0, min(arena_rect.height, self.position.y))
+        # Update image rotation from the pre-rotated frames, only when turned
+        if self.angle != self._rot_angle:
+            self._rot_angle = self.angle
+            rot_index = round(self.angle / self.ROTATION_STEP) % len(self._rot_frames)
+            if rot_index != self._rot_index:
+                self._rot_index = rot_index
+                self.image = self._rot_frames[rot_index]
+                self.rect = self._rot_rects[rot_index].copy()
         
         # Update rect position
         self.rect.center = self.position
         
-        # Update image rotation
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
-        
         # Update boost
         if not self.is_boosting and self.boost_fuel < self.max_boost_fuel:
             self.boost_fuel = min(
@@ -171,39 +274,69 @@ class Ship(pygame.sprite.Sprite):
             )
         
         # Update abilities
-        for ability in self.abilities.values():
+        for ability in self._ability_list:
             if not ability['ready']:
-                ability['timer'] += dt
-                if ability['timer'] >= ability['cooldown']:
+                timer = ability['timer'] + dt
+                if timer >= ability['cooldown']:
                     ability['ready'] = True
-                    ability['timer'] = 0
+                    timer = 0
+                ability['timer'] = timer
         
         # Update shield
-        if self.abilities['shield']['active']:
-            self.abilities['shield']['timer'] += dt
-            if self.abilities['shield']['timer'] >= self.abilities['shield']['duration']:
-                self.abilities['shield']['active'] = False
-                self.abilities['shield']['ready'] = False
-                self.abilities['shield']['timer'] = 0
+        shield = self._shield_ability
+        if shield['active']:
+            timer = shield['timer'] + dt
+            if timer >= shield['duration']:
+                shield['active'] = False
+                shield['ready'] = False
+                timer = 0
+            shield['timer'] = timer
         
         # Update particles
         self.update_particles(dt)
     
     def thrust(self, amount):
         """Apply thrust in current direction."""
-        thrust_vector = pygame.math.Vector2()
-        thrust_vector.from_polar((amount * self.speed, -self.angle))
-        self.acceleration = thrust_vector
+        c, s = cos_sin(self.angle)
+        magnitude = amount * self.speed
+        self.acceleration.update(magnitude * c, -magnitude * s)
         
         # Add thrust particles
         if amount > 0:
             self.add_thrust_particles()
     
-    def rotate(self, direction):
+    def rotate(self, direction, dt):
         """Rotate the ship. Direction should be -1 (left) or 1 (right)."""
         rotation_speed = 180  # degrees per second
-        self.angle += direction * rotation_speed * 0.016  # Assuming 60 FPS
-        self.angle %= 360
+        angle = self.angle + direction * rotation_speed * dt
+        
+        # Wrap into [0, 360) without a float modulo
+        if angle >= 360.0:
+            angle -= 360.0
+        elif angle < 0.0:
+            angle += 360.0
+        self.angle = angle
+    
+    def get_ai_command(self, target_pos):
+        """Return the cached AI (rotate, thrust) command, or None if it is stale.
+        
+        The command stays valid while this ship hasn't turned and neither it
+        nor the target has moved more than AI_REPLAN_DIST_SQ since it was set.
+        """
+        if self.ai_command is None or self.angle != self.ai_command_angle:
+            return None
+        if (self.position - self.ai_command_pos).length_squared() >= self.AI_REPLAN_DIST_SQ:
+            return None
+        if (target_pos - self.ai_target_pos).length_squared() >= self.AI_REPLAN_DIST_SQ:
+            return None
+        return self.ai_command
+    
+    def set_ai_command(self, command, target_pos):
+        """Cache an AI (rotate, thrust) command with the positions it was decided from."""
+        self.ai_command = command
+        self.ai_command_pos = self.position.copy()
+        self.ai_command_angle = self.angle
+        self.ai_target_pos = pygame.math.Vector2(target_pos)
     
     def boost(self):
         """Activate boost if enough fuel."""
@@ -271,79 +404,52 @@ class Ship(pygame.sprite.Sprite):
     def add_thrust_particles(self):
         """Add thrust particle effects."""
         # Calculate particle spawn position
-        angle_rad = math.radians(self.angle)
+        c, s = cos_sin(self.angle)
         offset = 20
-        spawn_x = self.position.x - math.cos(angle_rad) * offset
-        spawn_y = self.position.y - math.sin(angle_rad) * offset
-        
-        # Add new particle
-        particle = {
-            'pos': pygame.math.Vector2(spawn_x, spawn_y),
-            'vel': pygame.math.Vector2(-math.cos(angle_rad) * 2, -math.sin(angle_rad) * 2),
-            'lifetime': 0.5,
-            'timer': 0,
-            'color': (255, 165, 0)  # Orange
-        }
-        self.thrust_particles.append(particle)
+        self.thrust_particles.add(
+            self.position.x - c * offset,
+            self.position.y - s * offset,
+            -c * 2, -s * 2
+        )
     
     def add_boost_particles(self):
         """Add boost particle effects."""
-        angle_rad = math.radians(self.angle)
+        c, s = cos_sin(self.angle)
         offset = 25
-        spawn_x = self.position.x - math.cos(angle_rad) * offset
-        spawn_y = self.position.y - math.sin(angle_rad) * offset
-        
-        # Add new particle
-        particle = {
-            'pos': pygame.math.Vector2(spawn_x, spawn_y),
-            'vel': pygame.math.Vector2(-math.cos(angle_rad) * 4, -math.sin(angle_rad) * 4),
-            'lifetime': 0.8,
-            'timer': 0,
-            'color': (0, 255, 255)  # Cyan
-        }
-        self.boost_particles.append(particle)
+        self.boost_particles.add(
+            self.position.x - c * offset,
+            self.position.y - s * offset,
+            -c * 4, -s * 4
+        )
     
     def update_particles(self, dt):
         """Update particle effects."""
-        # Update thrust particles
-        for particle in self.thrust_particles[:]:
-            particle['timer'] += dt
-            if particle['timer'] >= particle['lifetime']:
-                self.thrust_particles.remove(particle)
-            else:
-                particle['pos'] += particle['vel']
-        
-        # Update boost particles
-        for particle in self.boost_particles[:]:
-            particle['timer'] += dt
-            if particle['timer'] >= particle['lifetime']:
-                self.boost_particles.remove(particle)
-            else:
-                particle['pos'] += particle['vel']
+        self.thrust_particles.update(dt)
+        self.boost_particles.update(dt)
     
     def draw_particles(self, surface):
         """Draw particle effects."""
-        # Draw thrust particles
-        for particle in self.thrust_particles:
-            alpha = 255 * (1 - particle['timer'] / particle['lifetime'])
-            color = (*particle['color'], int(alpha))
+        self.thrust_particles.draw(surface)
+        self.boost_particles.draw(surface)
+    
+    @classmethod
+    def get_shield_surface(cls, radius, alpha):
+        """Return a cached shield ring overlay for a radius and alpha."""
+        alpha = alpha // cls.SHIELD_ALPHA_STEP * cls.SHIELD_ALPHA_STEP
+        key = (radius, alpha)
+        shield_surface = cls._shield_cache.get(key)
+        if shield_surface is None:
+            shield_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(
-                surface,
-                color,
-                particle['pos'],
+                shield_surface,
+                (0, 255, 255, alpha),  # Cyan with alpha
+                (radius, radius),
+                radius,
                 2
             )
-        
-        # Draw boost particles
-        for particle in self.boost_particles:
-            alpha = 255 * (1 - particle['timer'] / particle['lifetime'])
-            color = (*particle['color'], int(alpha))
-            pygame.draw.circle(
-                surface,
-                color,
-                particle['pos'],
-                3
-            )
+            shield_surface = convert_alpha(shield_surface)
+            cls._shield_cache[key] = shield_surface
+        return shield_surface
     
     def draw(self, surface):
         """Draw the ship and its effects."""
@@ -355,19 +461,9 @@ class Ship(pygame.sprite.Sprite):
         
         # Draw shield if active
         if self.abilities['shield']['active']:
-            shield_radius = max(self.rect.width, self.rect.height)
-            shield_surface = pygame.Surface(
-                (shield_radius * 2, shield_radius * 2),
-                pygame.SRCALPHA
-            )
+            shield_radius = self.shield_radius
             alpha = int(128 * (1 - self.abilities['shield']['timer'] / self.abilities['shield']['duration']))
-            pygame.draw.circle(
-                shield_surface,
-                (0, 255, 255, alpha),  # Cyan with alpha
-                (shield_radius, shield_radius),
-                shield_radius,
-                2
-            )
+            shield_surface = self.get_shield_surface(shield_radius, alpha)
             surface.blit(
                 shield_surface,
                 (self.rect.centerx - shield_radius, self.rect.centery - shield_radius)
@@ -4,15 +4,79 @@ A single-player space shooter with waves of enemy aircraft.
 """
 
 import pygame
-import sys
-import os
 import math
 import random
+import time
+import asyncio
 from enum import Enum
+from collections import deque
+from itertools import compress
 
-# Add parent directory to path to import from utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from ...config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from ...utils.spatial_hash import SpatialHashGrid
+from ...utils.fonts import get_sysfont
+from ...utils.helper import convert_alpha
+
+# Use the spatial hash once enemy x bullet pairs reach this count
+COLLISION_GRID_THRESHOLD = 32
+
+# Simulation runs in fixed steps; long frames are clamped to avoid a
+# spiral of catch-up updates
+FIXED_DT = 1.0 / FPS
+MAX_FRAME_TIME = 0.25
+
+# Enemies spawn this far past the right edge and are removed once they are
+# this far off any edge; bullets are removed as soon as they leave the screen
+ENEMY_SPAWN_OFFSET = 50
+ENEMY_CULL_MARGIN = ENEMY_SPAWN_OFFSET
+BULLET_CULL_MARGIN = 0
+
+# Sine lookup table for the enemy wave pattern
+_SIN_LUT_SIZE = 4096
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)  # Radians to table index
+_SIN_LUT = [math.sin(i / _SIN_LUT_SCALE) for i in range(_SIN_LUT_SIZE)]
+
+# Alpha added by the white hit-flash overlay
+HIT_FLASH_ALPHA = 25
+
+_flash_cache = {}
+
+def get_flash_image(image):
+    """Return the white hit-flash version of a shared sprite image."""
+    flash_image = _flash_cache.get(image)
+    if flash_image is None:
+        flash_image = image.copy()
+        flash_image.fill((255, 255, 255, HIT_FLASH_ALPHA), special_flags=pygame.BLEND_ADD)
+        _flash_cache[image] = flash_image
+    return flash_image
+
+def _step_player(x, y, vx, vy, ax, ay, dt, drag, half_size):
+    """Integrate one player step on plain floats.
+    
+    Returns the new (x, y, vx, vy), with the position clamped to the screen.
+    """
+    vx = (vx + ax * dt) * drag
+    vy = (vy + ay * dt) * drag
+    x += vx * dt
+    y += vy * dt
+    
+    # Keep player on screen
+    x = max(half_size, min(x, SCREEN_WIDTH - half_size))
+    y = max(half_size, min(y, SCREEN_HEIGHT - half_size))
+    return x, y, vx, vy
+
+_particle_cache = {}
+
+def get_particle_image(radius):
+    """Return the pre-rendered engine particle image for a radius."""
+    image = _particle_cache.get(radius)
+    if image is None:
+        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 165, 0), (radius, radius), radius)
+        image = convert_alpha(image)
+        _particle_cache[radius] = image
+    return image
 
 class GameState(Enum):
     """Game state enumeration."""
@@ -21,47 +85,128 @@ class GameState(Enum):
     PAUSED = 3
     GAME_OVER = 4
 
+class EngineParticles:
+    """Engine exhaust particles stored as parallel lists (structure of arrays)."""
+    
+    __slots__ = ('xs', 'ys', 'vxs', 'vys', 'timers', 'lifetimes', 'sizes')
+    
+    def __init__(self):
+        self.xs = []
+        self.ys = []
+        self.vxs = []
+        self.vys = []
+        self.timers = []
+        self.lifetimes = []
+        self.sizes = []
+    
+    def __len__(self):
+        return len(self.timers)
+    
+    def add(self, x, y, vx, vy, lifetime, size):
+        """Spawn a particle moving (vx, vy) pixels per second."""
+        self.xs.append(x)
+        self.ys.append(y)
+        self.vxs.append(vx)
+        self.vys.append(vy)
+        self.timers.append(0)
+        self.lifetimes.append(lifetime)
+        self.sizes.append(int(size))  # Radius in whole pixels, one image per size
+    
+    def update(self, dt):
+        """Age all particles, drop expired ones and move the rest."""
+        if not self.timers:
+            return
+        
+        timers = [timer + dt for timer in self.timers]
+        alive = [timer < lifetime for timer, lifetime in zip(timers, self.lifetimes)]
+        if not all(alive):
+            timers = list(compress(timers, alive))
+            self.xs = list(compress(self.xs, alive))
+            self.ys = list(compress(self.ys, alive))
+            self.vxs = list(compress(self.vxs, alive))
+            self.vys = list(compress(self.vys, alive))
+            self.lifetimes = list(compress(self.lifetimes, alive))
+            self.sizes = list(compress(self.sizes, alive))
+        
+        self.timers = timers
+        self.xs = [x + vx * dt for x, vx in zip(self.xs, self.vxs)]
+        self.ys = [y + vy * dt for y, vy in zip(self.ys, self.vys)]
+    
+    def blit_sequence(self):
+        """Return (image, position) pairs for Surface.blits."""
+        return [
+            (get_particle_image(size), (x - size, y - size))
+            for x, y, size in zip(self.xs, self.ys, self.sizes)
+        ]
+
 class Player(pygame.sprite.Sprite):
     """Player ship class."""
     
-    def __init__(self, x, y):
-        super().__init__()
-        self.size = 50
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+    __slots__ = (
+        'size', 'image', 'flash_image', 'rect', 'pos_x', 'pos_y', 'prev_x',
+        'prev_y', 'vel_x', 'vel_y', 'speed', 'vertical_speed', 'drag', 'health',
+        'max_health', 'fire_delay', 'fire_timer', 'hit_flash', 'engine_particles',
+        'particle_clock', 'next_particle_at'
+    )
+    
+    SIZE = 50
+    PARTICLE_RATE = 18.0  # Engine particles per second while moving
+    _image_cache = {}
+    
+    @classmethod
+    def _get_image(cls):
+        """Build the player ship image once and share it between instances."""
+        image = cls._image_cache.get(None)
+        if image is not None:
+            return image
+        
+        size = cls.SIZE
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Create a modern-looking player ship
         points = [
-            (self.size, self.size//2),     # Nose (pointing right)
-            (0, 0),                        # Top back
-            (self.size//4, self.size//2),  # Middle indent
-            (0, self.size),                # Bottom back
+            (size, size//2),     # Nose (pointing right)
+            (0, 0),              # Top back
+            (size//4, size//2),  # Middle indent
+            (0, size),           # Bottom back
         ]
         
         # Draw the ship body
-        pygame.draw.polygon(self.image, (0, 255, 200), points)  # Cyan body
+        pygame.draw.polygon(image, (0, 255, 200), points)  # Cyan body
         
         # Add engine glow
         glow_points = [
-            (self.size//4, self.size//2),  # Middle
-            (0, self.size//4),             # Top
-            (0, 3*self.size//4)            # Bottom
+            (size//4, size//2),  # Middle
+            (0, size//4),        # Top
+            (0, 3*size//4)       # Bottom
         ]
-        pygame.draw.polygon(self.image, (255, 165, 0), glow_points)  # Orange glow
+        pygame.draw.polygon(image, (255, 165, 0), glow_points)  # Orange glow
         
         # Add details
-        pygame.draw.line(self.image, (255, 255, 255), 
-                        (self.size//2, self.size//4),
-                        (3*self.size//4, self.size//2), 2)
-        pygame.draw.line(self.image, (255, 255, 255),
-                        (self.size//2, 3*self.size//4),
-                        (3*self.size//4, self.size//2), 2)
+        pygame.draw.line(image, (255, 255, 255), 
+                        (size//2, size//4),
+                        (3*size//4, size//2), 2)
+        pygame.draw.line(image, (255, 255, 255),
+                        (size//2, 3*size//4),
+                        (3*size//4, size//2), 2)
+        
+        image = convert_alpha(image)
+        cls._image_cache[None] = image
+        return image
+    
+    def __init__(self, x, y):
+        super().__init__()
+        self.size = self.SIZE
+        self.image = self._get_image()
+        self.flash_image = get_flash_image(self.image)
         
         self.rect = self.image.get_rect()
-        self.position = pygame.math.Vector2(x, y)
-        self.rect.center = self.position
+        self.pos_x, self.pos_y = x, y
+        self.prev_x, self.prev_y = x, y  # Position before the last step
+        self.rect.center = (int(x), int(y))
         
         # Movement
-        self.velocity = pygame.math.Vector2(0, 0)
+        self.vel_x = self.vel_y = 0.0
         self.speed = 300
         self.vertical_speed = 450  # Increased vertical speed
         self.drag = 0.9
@@ -74,32 +219,29 @@ class Player(pygame.sprite.Sprite):
         
         # Effects
         self.hit_flash = 0
-        self.engine_particles = []
+        self.engine_particles = EngineParticles()
+        self.particle_clock = 0.0
+        self.next_particle_at = random.expovariate(self.PARTICLE_RATE)
     
-    def update(self, dt):
-        """Update player state."""
-        # Get keyboard input
-        keys = pygame.key.get_pressed()
+    def update(self, dt, keys):
+        """Update player state from this frame's keyboard snapshot."""
+        self.prev_x, self.prev_y = self.pos_x, self.pos_y
         
         # Movement
         dx = (keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT])
         dy = (keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP])
         
-        # Apply movement with different speeds for horizontal and vertical
-        self.velocity.x += dx * self.speed * dt
-        self.velocity.y += dy * self.vertical_speed * dt
-        
-        # Apply drag
-        self.velocity *= self.drag
-        
-        # Update position
-        self.position += self.velocity * dt
-        
-        # Keep player on screen
-        self.position.x = max(self.size//2, min(self.position.x, SCREEN_WIDTH - self.size//2))
-        self.position.y = max(self.size//2, min(self.position.y, SCREEN_HEIGHT - self.size//2))
+        # Apply movement with different speeds for horizontal and vertical,
+        # then drag
+        x, y, vx, vy = _step_player(
+            self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+            dx * self.speed, dy * self.vertical_speed,
+            dt, self.drag, self.size//2
+        )
+        self.pos_x, self.pos_y = x, y
+        self.vel_x, self.vel_y = vx, vy
         
-        self.rect.center = self.position
+        self.rect.center = (int(x), int(y))
         
         # Update fire timer
         if self.fire_timer > 0:
@@ -112,10 +254,12 @@ class Player(pygame.sprite.Sprite):
         # Update engine particles
         self.update_engine_particles(dt)
         
-        # Add engine particles based on movement
-        if abs(self.velocity.x) > 1 or abs(self.velocity.y) > 1:
-            if random.random() < 0.3:
+        # Add engine particles based on movement, at scheduled times
+        if abs(vx) > 1 or abs(vy) > 1:
+            self.particle_clock += dt
+            while self.particle_clock >= self.next_particle_at:
                 self.add_engine_particle()
+                self.next_particle_at += random.expovariate(self.PARTICLE_RATE)
     
     def shoot(self):
         """Try to fire a bullet."""
@@ -126,95 +270,107 @@ class Player(pygame.sprite.Sprite):
     
     def add_engine_particle(self):
         """Add a new engine particle."""
-        particle = {
-            'pos': pygame.math.Vector2(self.rect.left + 5, self.rect.centery + random.randint(-5, 5)),
-            'vel': pygame.math.Vector2(-random.uniform(50, 100), random.uniform(-20, 20)),
-            'lifetime': random.uniform(0.5, 1.0),
-            'timer': 0,
-            'size': random.uniform(2, 4)
-        }
-        self.engine_particles.append(particle)
+        self.engine_particles.add(
+            self.rect.left + 5, self.rect.centery + random.randint(-5, 5),
+            -random.uniform(50, 100), random.uniform(-20, 20),
+            random.uniform(0.5, 1.0),
+            random.uniform(2, 4)
+        )
     
     def update_engine_particles(self, dt):
         """Update engine particle effects."""
-        # Update existing particles
-        for particle in self.engine_particles[:]:
-            particle['timer'] += dt
-            if particle['timer'] >= particle['lifetime']:
-                self.engine_particles.remove(particle)
-            else:
-                particle['pos'] += particle['vel'] * dt
+        self.engine_particles.update(dt)
     
-    def draw(self, surface):
-        """Draw the player ship with effects."""
-        # Draw engine particles
-        for particle in self.engine_particles:
-            alpha = 255 * (1 - particle['timer'] / particle['lifetime'])
-            pygame.draw.circle(
-                surface,
-                (255, 165, 0, int(alpha)),
-                (int(particle['pos'].x), int(particle['pos'].y)),
-                int(particle['size'])
-            )
-        
-        # Draw ship
-        if self.hit_flash > 0:
-            # Create a white flash effect
-            flash_image = self.image.copy()
-            flash_image.fill((255, 255, 255, int(self.hit_flash * 255)), special_flags=pygame.BLEND_ADD)
-            surface.blit(flash_image, self.rect)
-        else:
-            surface.blit(self.image, self.rect)
+    def blit_sequence(self):
+        """Return the engine particles and ship as (image, position) pairs for blits."""
+        blits = self.engine_particles.blit_sequence()
+        blits.append((self.flash_image if self.hit_flash > 0 else self.image, self.rect))
+        return blits
 
 class Enemy(pygame.sprite.Sprite):
     """Enemy aircraft class."""
     
-    def __init__(self, x, y):
-        super().__init__()
-        self.size = 40
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+    __slots__ = (
+        'size', 'image', 'flash_image', 'rect', 'pos_x', 'pos_y', 'prev_x',
+        'prev_y', 'dir_x', 'dir_y', 'speed', 'movement_pattern', 'move_step', 'sine_amplitude',
+        'sine_frequency', 'sine_offset', 'sine_index_scale', 'sine_index_offset',
+        'zigzag_timer', 'zigzag_interval', 'zigzag_direction', 'health',
+        'damage', 'score_value', 'hit_flash', 'engine_particles',
+        'particle_clock', 'next_particle_at'
+    )
+    
+    SIZE = 40
+    PARTICLE_RATE = 12.0  # Engine particles per second
+    
+    # Reddish body colors; a small fixed palette keeps the image cache tiny
+    TINTS = [(r, g, b) for r in (214, 241) for g in (25, 75) for b in (25, 75)]
+    _image_cache = {}
+    
+    @classmethod
+    def _get_image(cls, tint):
+        """Build the enemy image for a body tint once and share it."""
+        image = cls._image_cache.get(tint)
+        if image is not None:
+            return image
+        
+        size = cls.SIZE
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
         
         # Create a modern-looking enemy ship facing left
         points = [
-            (0, self.size//2),           # Nose (pointing left)
-            (self.size//2, 0),           # Top wing
-            (self.size, self.size//4),    # Top back
-            (self.size, 3*self.size//4),  # Bottom back
-            (self.size//2, self.size),    # Bottom wing
+            (0, size//2),           # Nose (pointing left)
+            (size//2, 0),           # Top wing
+            (size, size//4),        # Top back
+            (size, 3*size//4),      # Bottom back
+            (size//2, size),        # Bottom wing
         ]
         
-        # Randomize enemy color for variety
-        r = random.randint(200, 255)
-        g = random.randint(0, 100)
-        b = random.randint(0, 100)
-        
         # Draw the ship body
-        pygame.draw.polygon(self.image, (r, g, b), points)  # Reddish body with variation
+        pygame.draw.polygon(image, tint, points)
         
         # Add some details
-        pygame.draw.line(self.image, (200, 200, 200), 
-                        (self.size//2, self.size//4),
-                        (3*self.size//4, self.size//2), 3)
-        pygame.draw.circle(self.image, (255, 255, 0), 
-                         (3*self.size//4, self.size//2), 5)  # Engine glow
+        pygame.draw.line(image, (200, 200, 200), 
+                        (size//2, size//4),
+                        (3*size//4, size//2), 3)
+        pygame.draw.circle(image, (255, 255, 0), 
+                         (3*size//4, size//2), 5)  # Engine glow
+        
+        image = convert_alpha(image)
+        cls._image_cache[tint] = image
+        return image
+    
+    def __init__(self, x, y):
+        super().__init__()
+        self.size = self.SIZE
+        
+        # Randomize enemy color for variety
+        self.image = self._get_image(random.choice(self.TINTS))
+        self.flash_image = get_flash_image(self.image)
         
         self.rect = self.image.get_rect()
-        self.position = pygame.math.Vector2(x, y)
-        self.rect.center = self.position
+        self.pos_x, self.pos_y = x, y
+        self.prev_x, self.prev_y = x, y  # Position before the last step
+        self.rect.center = (int(x), int(y))
         
         # Movement
         self.speed = random.uniform(3, 5)
         
         # Choose a movement pattern
-        pattern = random.choice(['straight', 'sine', 'zigzag', 'dive'])
+        pattern = random.choice(list(self.MOVE_STEPS))
         self.movement_pattern = pattern
+        self.move_step = self.MOVE_STEPS[pattern]
         
         # Pattern-specific variables
-        self.direction = pygame.math.Vector2(-1, random.uniform(-0.2, 0.2))
-        self.direction = self.direction.normalize()
+        dir_y = random.uniform(-0.2, 0.2)
+        length = math.hypot(1.0, dir_y)
+        self.dir_x, self.dir_y = -1.0 / length, dir_y / length
         self.sine_amplitude = random.uniform(2, 5)
         self.sine_frequency = random.uniform(1, 3)
         self.sine_offset = random.uniform(0, 6.28)  # Random phase (0 to 2π)
+        
+        # Same wave expressed in sine table indices
+        self.sine_index_scale = 0.01 * self.sine_frequency * _SIN_LUT_SCALE
+        self.sine_index_offset = self.sine_offset * _SIN_LUT_SCALE
         self.zigzag_timer = 0
         self.zigzag_interval = random.uniform(0.5, 1.5)
         self.zigzag_direction = 1
@@ -226,41 +382,55 @@ class Enemy(pygame.sprite.Sprite):
         
         # Effects
         self.hit_flash = 0
-        self.engine_particles = []
+        self.engine_particles = EngineParticles()
+        self.particle_clock = 0.0
+        self.next_particle_at = random.expovariate(self.PARTICLE_RATE)
         
+    def _move_straight(self, x, y, dt):
+        """Simple straight movement."""
+        return x + self.dir_x * self.speed, y + self.dir_y * self.speed
+    
+    def _move_sine(self, x, y, dt):
+        """Sinusoidal movement."""
+        x -= self.speed
+        index = int(x * self.sine_index_scale + self.sine_index_offset) & _SIN_LUT_MASK
+        return x, y + _SIN_LUT[index] * self.sine_amplitude
+    
+    def _move_zigzag(self, x, y, dt):
+        """Zigzag movement."""
+        self.zigzag_timer += dt
+        if self.zigzag_timer >= self.zigzag_interval:
+            self.zigzag_timer = 0
+            self.zigzag_direction *= -1
+        
+        speed = self.speed
+        return x - speed, y + self.zigzag_direction * speed * 0.5
+    
+    def _move_dive(self, x, y, dt):
+        """Dive toward player's last known position."""
+        speed = self.speed
+        if x > SCREEN_WIDTH * 0.7:
+            # Just enter the screen normally
+            return x - speed, y
+        # Dive down faster
+        return x - speed * 0.7, y + speed * 1.2
+    
+    # Movement step for each pattern, looked up once at spawn
+    MOVE_STEPS = {
+        'straight': _move_straight,
+        'sine': _move_sine,
+        'zigzag': _move_zigzag,
+        'dive': _move_dive
+    }
+    
     def update(self, dt):
         """Update enemy position and effects."""
-        # Apply movement pattern
-        if self.movement_pattern == 'straight':
-            # Simple straight movement
-            self.position += self.direction * self.speed
-            
-        elif self.movement_pattern == 'sine':
-            # Sinusoidal movement
-            self.position.x -= self.speed
-            self.position.y += math.sin(self.position.x * 0.01 * self.sine_frequency + self.sine_offset) * self.sine_amplitude
-            
-        elif self.movement_pattern == 'zigzag':
-            # Zigzag movement
-            self.zigzag_timer += dt
-            if self.zigzag_timer >= self.zigzag_interval:
-                self.zigzag_timer = 0
-                self.zigzag_direction *= -1
-                
-            self.position.x -= self.speed
-            self.position.y += self.zigzag_direction * self.speed * 0.5
-            
-        elif self.movement_pattern == 'dive':
-            # Dive toward player's last known position
-            if self.position.x > SCREEN_WIDTH * 0.7:
-                # Just enter the screen normally
-                self.position.x -= self.speed
-            else:
-                # Dive down faster
-                self.position.x -= self.speed * 0.7
-                self.position.y += self.speed * 1.2
+        self.prev_x, self.prev_y = self.pos_x, self.pos_y
         
-        self.rect.center = self.position
+        # Apply movement pattern
+        x, y = self.move_step(self, self.pos_x, self.pos_y, dt)
+        self.pos_x, self.pos_y = x, y
+        self.rect.center = (int(x), int(y))
         
         # Update hit flash effect
         if self.hit_flash > 0:
@@ -269,101 +439,93 @@ class Enemy(pygame.sprite.Sprite):
         # Update engine particles
         self.update_engine_particles(dt)
         
-        # Add engine particles
-        if random.random() < 0.2:
+        # Add engine particles at scheduled times
+        self.particle_clock += dt
+        while self.particle_clock >= self.next_particle_at:
             self.add_engine_particle()
-        
-        # Remove if off screen
-        if self.rect.right < -50 or self.rect.left > SCREEN_WIDTH + 50 or \
-           self.rect.bottom < -50 or self.rect.top > SCREEN_HEIGHT + 50:
-            self.kill()
+            self.next_particle_at += random.expovariate(self.PARTICLE_RATE)
     
     def add_engine_particle(self):
         """Add a new engine particle."""
-        particle = {
-            'pos': pygame.math.Vector2(self.rect.right - 5, self.rect.centery + random.randint(-5, 5)),
-            'vel': pygame.math.Vector2(random.uniform(50, 100), random.uniform(-20, 20)),
-            'lifetime': random.uniform(0.3, 0.7),
-            'timer': 0,
-            'size': random.uniform(1, 3)
-        }
-        self.engine_particles.append(particle)
+        self.engine_particles.add(
+            self.rect.right - 5, self.rect.centery + random.randint(-5, 5),
+            random.uniform(50, 100), random.uniform(-20, 20),
+            random.uniform(0.3, 0.7),
+            random.uniform(1, 3)
+        )
     
     def update_engine_particles(self, dt):
         """Update engine particle effects."""
-        # Update existing particles
-        for particle in self.engine_particles[:]:
-            particle['timer'] += dt
-            if particle['timer'] >= particle['lifetime']:
-                self.engine_particles.remove(particle)
-            else:
-                particle['pos'] += particle['vel'] * dt
+        self.engine_particles.update(dt)
     
-    def draw(self, surface):
-        """Draw the enemy with effects."""
-        # Draw engine particles
-        for particle in self.engine_particles:
-            alpha = 255 * (1 - particle['timer'] / particle['lifetime'])
-            pygame.draw.circle(
-                surface,
-                (255, 165, 0, int(alpha)),
-                (int(particle['pos'].x), int(particle['pos'].y)),
-                int(particle['size'])
-            )
-        
-        # Draw ship
-        if self.hit_flash > 0:
-            # Create a white flash effect
-            flash_image = self.image.copy()
-            flash_image.fill((255, 255, 255, int(self.hit_flash * 255)), special_flags=pygame.BLEND_ADD)
-            surface.blit(flash_image, self.rect)
-        else:
-            surface.blit(self.image, self.rect)
+    def blit_sequence(self):
+        """Return the engine particles and ship as (image, position) pairs for blits."""
+        blits = self.engine_particles.blit_sequence()
+        blits.append((self.flash_image if self.hit_flash > 0 else self.image, self.rect))
+        return blits
 
 class Bullet(pygame.sprite.Sprite):
     """Player bullet class."""
     
+    __slots__ = (
+        'bullet_type', 'size', 'image', 'rect', 'pos_x', 'pos_y', 'prev_x',
+        'prev_y', 'speed', 'damage', 'trail', 'max_trail_length'
+    )
+    
+    _image_cache = {}
+    
+    @classmethod
+    def _get_image(cls, bullet_type):
+        """Build the image for a bullet type once and share it."""
+        image = cls._image_cache.get(bullet_type)
+        if image is not None:
+            return image
+        
+        if bullet_type == "standard":
+            # Create an energy bolt effect
+            size = 20
+            image = pygame.Surface((size, 8), pygame.SRCALPHA)
+            
+            # Draw energy bolt
+            pygame.draw.ellipse(image, (0, 255, 255), (0, 0, size, 8))  # Cyan core
+            pygame.draw.ellipse(image, (255, 255, 255), (size//4, 2, size//2, 4))  # White center
+        
+        image = convert_alpha(image)
+        cls._image_cache[bullet_type] = image
+        return image
+    
     def __init__(self, x, y, bullet_type="standard"):
         super().__init__()
         self.bullet_type = bullet_type
         
         if bullet_type == "standard":
-            # Create an energy bolt effect
+            # Energy bolt
             self.size = 20
-            self.image = pygame.Surface((self.size, 8), pygame.SRCALPHA)
-            
-            # Draw energy bolt
-            pygame.draw.ellipse(self.image, (0, 255, 255), (0, 0, self.size, 8))  # Cyan core
-            pygame.draw.ellipse(self.image, (255, 255, 255), (self.size//4, 2, self.size//2, 4))  # White center
+            self.image = self._get_image(bullet_type)
             
             self.speed = 800
             self.damage = 10
         
         self.rect = self.image.get_rect()
-        self.position = pygame.math.Vector2(x, y)
-        self.rect.center = self.position
+        self.pos_x, self.pos_y = x, y
+        self.prev_x, self.prev_y = x, y  # Position before the last step
+        self.rect.center = (int(x), int(y))
         
         # Trail effect
-        self.trail = []
         self.max_trail_length = 5
+        self.trail = deque(maxlen=self.max_trail_length)  # Oldest points drop off automatically
     
     def update(self, dt):
         """Update bullet position."""
-        self.position.x += self.speed * dt
-        self.rect.center = self.position
+        self.prev_x, self.prev_y = self.pos_x, self.pos_y
+        self.pos_x += self.speed * dt
+        self.rect.center = (int(self.pos_x), int(self.pos_y))
         
         # Update trail
-        self.trail.append((int(self.position.x), int(self.position.y)))
-        if len(self.trail) > self.max_trail_length:
-            self.trail.pop(0)
-        
-        # Remove if off screen
-        if self.rect.left > SCREEN_WIDTH or self.rect.right < 0:
-            self.kill()
+        self.trail.append(self.rect.center)
     
-    def draw(self, surface):
-        """Draw the bullet with trail effect."""
-        # Draw trail
+    def draw_trail(self, surface):
+        """Draw the bullet trail."""
         if len(self.trail) > 1:
             pygame.draw.lines(
                 surface,
@@ -372,9 +534,10 @@ class Bullet(pygame.sprite.Sprite):
                 self.trail,
                 2
             )
-        
-        # Draw bullet
-        surface.blit(self.image, self.rect)
+    
+    def blit_sequence(self):
+        """Return the bullet as (image, position) pairs for blits."""
+        return [(self.image, self.rect)]
 
 class Game:
     """Main game class."""
@@ -384,11 +547,11 @@ class Game:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Rocket Rumble")
-        self.clock = pygame.time.Clock()
         
         # Game state
         self.state = GameState.MENU
         self.running = True
+        self.keys = pygame.key.get_pressed()  # Keyboard snapshot for the current frame
         self.score = 0
         self.wave = 1
         
@@ -397,6 +560,9 @@ class Game:
         self.enemies = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
         
+        # Broad-phase grid for bullets, reused every frame
+        self.collision_grid = SpatialHashGrid(Enemy.SIZE * 2)
+        
         # Create player
         self.player = Player(100, SCREEN_HEIGHT//2)
         self.all_sprites.add(self.player)
@@ -408,55 +574,95 @@ class Game:
         self.enemies_spawned = 0
         
         # Load fonts
-        self.title_font = pygame.font.SysFont("Arial", 48)
-        self.menu_font = pygame.font.SysFont("Arial", 32)
-        self.hud_font = pygame.font.SysFont("Arial", 24)
+        self.title_font = get_sysfont("Arial", 48)
+        self.menu_font = get_sysfont("Arial", 32)
+        self.hud_font = get_sysfont("Arial", 24)
+        
+        # Pre-render text that never changes
+        white = (255, 255, 255)
+        center_x = SCREEN_WIDTH // 2
+        self.title_text = self.title_font.render("ROCKET RUMBLE", True, (0, 255, 255))
+        self.title_rect = self.title_text.get_rect(center=(center_x, SCREEN_HEIGHT//3))
+        self.start_text = self.menu_font.render("Press ENTER to Start", True, white)
+        self.start_rect = self.start_text.get_rect(midtop=(center_x, SCREEN_HEIGHT//2))
+        self.quit_text = self.menu_font.render("Press ESC to Quit", True, white)
+        self.quit_rect = self.quit_text.get_rect(midtop=(center_x, SCREEN_HEIGHT//2 + 50))
+        self.pause_text = self.title_font.render("PAUSED", True, white)
+        self.pause_rect = self.pause_text.get_rect(midtop=(center_x, SCREEN_HEIGHT//2 - 50))
+        self.resume_text = self.menu_font.render("Press ESC to Resume", True, white)
+        self.resume_rect = self.resume_text.get_rect(midtop=(center_x, SCREEN_HEIGHT//2 + 50))
+        self.game_over_text = self.title_font.render("GAME OVER", True, (255, 0, 0))
+        self.game_over_rect = self.game_over_text.get_rect(midtop=(center_x, SCREEN_HEIGHT//3))
+        self.restart_text = self.menu_font.render("Press ENTER to Return to Menu", True, white)
+        self.restart_rect = self.restart_text.get_rect(midtop=(center_x, SCREEN_HEIGHT//2 + 100))
+        
+        # Text that depends on game values, re-rendered only when they change
+        self._score_cache = (None, None)
+        self._wave_cache = (None, None)
+        self._final_cache = (None, None)
         
         # Create stars for background
         self.stars = self.create_stars()
+        
+        # Semi-transparent overlays for the pause and game over screens
+        self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.pause_overlay.fill((0, 0, 0))
+        self.pause_overlay.set_alpha(128)
+        self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game_over_overlay.fill((0, 0, 0))
+        self.game_over_overlay.set_alpha(192)
     
     def create_stars(self):
-        """Create parallax starfield."""
+        """Create parallax starfield.
+        
+        Stars in a layer share speed, size and brightness, so each layer
+        keeps its positions in parallel lists and one pre-rendered star image.
+        """
         stars = []
         for layer in range(3):
-            layer_stars = []
-            for _ in range(50):
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                speed = 0.5 + layer * 0.5  # Different speeds for parallax
-                size = 1 + layer
-                brightness = min(255, 128 + layer * 64)
-                layer_stars.append({
-                    'pos': pygame.math.Vector2(x, y),
-                    'speed': speed,
-                    'size': size,
-                    'brightness': brightness
-                })
-            stars.append(layer_stars)
+            size = 1 + layer
+            brightness = min(255, 128 + layer * 64)
+            
+            image = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(
+                image,
+                (brightness, brightness, brightness),
+                (size, size),
+                size
+            )
+            
+            stars.append({
+                'xs': [random.randint(0, SCREEN_WIDTH) for _ in range(50)],
+                'ys': [random.randint(0, SCREEN_HEIGHT) for _ in range(50)],
+                'speed': 0.5 + layer * 0.5,  # Different speeds for parallax
+                'size': size,
+                'image': image.convert_alpha()
+            })
         return stars
     
     def update_stars(self, dt):
         """Update star positions."""
         for layer in self.stars:
-            for star in layer:
-                star['pos'].x -= star['speed']
-                if star['pos'].x < 0:
-                    star['pos'].x = SCREEN_WIDTH
-                    star['pos'].y = random.randint(0, SCREEN_HEIGHT)
+            speed = layer['speed']
+            xs = [x - speed for x in layer['xs']]
+            ys = layer['ys']
+            for i, x in enumerate(xs):
+                if x < 0:
+                    xs[i] = SCREEN_WIDTH
+                    ys[i] = random.randint(0, SCREEN_HEIGHT)
+            layer['xs'] = xs
     
     def draw_stars(self):
-        """Draw parallax starfield."""
+        """Draw parallax starfield with one batched blit per layer."""
         for layer in self.stars:
-            for star in layer:
-                brightness = int(star['brightness'])
-                pygame.draw.circle(
-                    self.screen,
-                    (brightness, brightness, brightness),
-                    (int(star['pos'].x), int(star['pos'].y)),
-                    int(star['size'])
-                )
-    
-    def spawn_enemy(self):
+            image = layer['image']
+            size = layer['size']
+            self.screen.blits(
+                [(image, (int(x) - size, y - size)) for x, y in zip(layer['xs'], layer['ys'])],
+                doreturn=False
+            )
+    
+    def spawn_enemy(self, dt):
         """Spawn a new enemy if conditions are met."""
         if self.enemies_spawned >= self.enemies_per_wave:
             if len(self.enemies) == 0:
@@ -467,13 +673,13 @@ class Game:
                 self.spawn_delay = max(0.5, self.spawn_delay - 0.1)
             return
         
-        self.spawn_timer += self.clock.get_time() / 1000.0
+        self.spawn_timer += dt
         if self.spawn_timer >= self.spawn_delay:
             self.spawn_timer = 0
             
             # Spawn enemy at random position on right side
             enemy = Enemy(
-                SCREEN_WIDTH + 50,
+                SCREEN_WIDTH + ENEMY_SPAWN_OFFSET,
                 random.randint(50, SCREEN_HEIGHT - 50)
             )
             self.enemies.add(enemy)
@@ -510,15 +716,19 @@ class Game:
             return
         
         # Spawn enemies
-        self.spawn_enemy()
+        self.spawn_enemy(dt)
         
-        # Update all sprites
+        # Drop enemies and bullets that have left the play area
+        self.cull_offscreen()
+        
+        # Update all sprites; only the player reads the keyboard
+        self.player.update(dt, self.keys)
         for sprite in self.all_sprites:
-            sprite.update(dt)
+            if sprite is not self.player:
+                sprite.update(dt)
         
         # Handle shooting
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_SPACE]:
+        if self.keys[pygame.K_SPACE]:
             bullet = self.player.shoot()
             if bullet:
                 self.bullets.add(bullet)
@@ -527,15 +737,51 @@ class Game:
         # Check collisions
         self.check_collisions()
     
+    def cull_offscreen(self):
+        """Kill every enemy and bullet that has left the play area."""
+        for group, margin in ((self.enemies, ENEMY_CULL_MARGIN), (self.bullets, BULLET_CULL_MARGIN)):
+            left, right = -margin, SCREEN_WIDTH + margin
+            top, bottom = -margin, SCREEN_HEIGHT + margin
+            for sprite in group.sprites():
+                rect = sprite.rect
+                if rect.right < left or rect.left > right or rect.bottom < top or rect.top > bottom:
+                    sprite.kill()
+    
     def check_collisions(self):
         """Check for collisions between game objects."""
-        # Bullets hitting enemies
-        hits = pygame.sprite.groupcollide(self.enemies, self.bullets, False, True)
-        for enemy, bullets in hits.items():
-            for bullet in bullets:
+        # Bullets hitting enemies: build the bullet rect list once per frame
+        bullets = self.bullets.sprites()
+        enemies = self.enemies.sprites()
+        bullet_rects = [bullet.rect for bullet in bullets]
+        
+        # With many pairs, bucket bullets into the grid so each enemy only
+        # rect-tests the bullets in its neighbouring cells
+        grid = None
+        if len(enemies) * len(bullets) >= COLLISION_GRID_THRESHOLD:
+            grid = self.collision_grid
+            grid.clear()
+            for index, rect in enumerate(bullet_rects):
+                grid.insert(index, rect.left, rect.top, rect.right, rect.bottom)
+        
+        for enemy in enemies:
+            rect = enemy.rect
+            if grid is None:
+                # Few pairs: test against every bullet in one C call
+                hits = rect.collidelistall(bullet_rects)
+            else:
+                candidates = grid.query(rect.left, rect.top, rect.right, rect.bottom)
+                hits = [i for i in sorted(candidates) if rect.colliderect(bullet_rects[i])]
+            
+            for index in hits:
+                bullet = bullets[index]
+                if not bullet.alive():
+                    # Already spent on another enemy this frame
+                    continue
+                bullet.kill()
+                
                 enemy.health -= bullet.damage
                 enemy.hit_flash = 0.1
-                if enemy.health <= 0:
+                if enemy.health <= 0 and enemy.alive():
                     self.score += enemy.score_value
                     enemy.kill()
         
@@ -555,34 +801,34 @@ class Game:
         self.draw_stars()
         
         # Draw title
-        title_surf = self.title_font.render("ROCKET RUMBLE", True, (0, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//3))
-        self.screen.blit(title_surf, title_rect)
+        self.screen.blit(self.title_text, self.title_rect)
         
         # Draw menu options
-        start_text = self.menu_font.render("Press ENTER to Start", True, (255, 255, 255))
-        quit_text = self.menu_font.render("Press ESC to Quit", True, (255, 255, 255))
-        
-        self.screen.blit(
-            start_text,
-            (SCREEN_WIDTH//2 - start_text.get_width()//2, SCREEN_HEIGHT//2)
-        )
-        self.screen.blit(
-            quit_text,
-            (SCREEN_WIDTH//2 - quit_text.get_width()//2, SCREEN_HEIGHT//2 + 50)
-        )
+        self.screen.blit(self.start_text, self.start_rect)
+        self.screen.blit(self.quit_text, self.quit_rect)
     
-    def draw_game(self):
-        """Draw the game screen."""
+    def draw_game(self, alpha=1.0):
+        """Draw the game screen, blending sprites between simulation steps."""
         self.screen.fill((0, 0, 0))
         self.draw_stars()
         
-        # Draw all sprites
+        # Place sprites between their previous and current positions
         for sprite in self.all_sprites:
-            if hasattr(sprite, 'draw'):
-                sprite.draw(self.screen)
-            else:
-                self.screen.blit(sprite.image, sprite.rect)
+            prev_x, prev_y = sprite.prev_x, sprite.prev_y
+            sprite.rect.center = (
+                int(prev_x + (sprite.pos_x - prev_x) * alpha),
+                int(prev_y + (sprite.pos_y - prev_y) * alpha)
+            )
+        
+        # Bullet trails are line draws, so they go underneath everything
+        for bullet in self.bullets:
+            bullet.draw_trail(self.screen)
+        
+        # Gather every sprite's blits, engine particles included, into one call
+        blits = []
+        for sprite in self.all_sprites:
+            blits.extend(sprite.blit_sequence())
+        self.screen.blits(blits, doreturn=False)
         
         # Draw HUD
         self.draw_hud()
@@ -590,12 +836,14 @@ class Game:
     def draw_hud(self):
         """Draw the heads-up display."""
         # Draw score
-        score_text = self.hud_font.render(f"Score: {self.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
+        if self._score_cache[0] != self.score:
+            self._score_cache = (self.score, self.hud_font.render(f"Score: {self.score}", True, (255, 255, 255)))
+        self.screen.blit(self._score_cache[1], (10, 10))
         
         # Draw wave number
-        wave_text = self.hud_font.render(f"Wave {self.wave}", True, (255, 255, 255))
-        self.screen.blit(wave_text, (10, 40))
+        if self._wave_cache[0] != self.wave:
+            self._wave_cache = (self.wave, self.hud_font.render(f"Wave {self.wave}", True, (255, 255, 255)))
+        self.screen.blit(self._wave_cache[1], (10, 40))
         
         # Draw health bar
         health_width = 200
@@ -613,67 +861,45 @@ class Game:
     
     def draw_pause(self):
         """Draw the pause screen overlay."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        # Darken the game behind the text
+        self.screen.blit(self.pause_overlay, (0, 0))
         
         # Draw pause text
-        pause_text = self.title_font.render("PAUSED", True, (255, 255, 255))
-        resume_text = self.menu_font.render("Press ESC to Resume", True, (255, 255, 255))
-        
-        self.screen.blit(
-            pause_text,
-            (SCREEN_WIDTH//2 - pause_text.get_width()//2, SCREEN_HEIGHT//2 - 50)
-        )
-        self.screen.blit(
-            resume_text,
-            (SCREEN_WIDTH//2 - resume_text.get_width()//2, SCREEN_HEIGHT//2 + 50)
-        )
+        self.screen.blit(self.pause_text, self.pause_rect)
+        self.screen.blit(self.resume_text, self.resume_rect)
     
     def draw_game_over(self):
         """Draw the game over screen."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(192)
-        self.screen.blit(overlay, (0, 0))
+        # Darken the game behind the text
+        self.screen.blit(self.game_over_overlay, (0, 0))
+        
+        # Render the final results once per game over
+        results = (self.score, self.wave)
+        if self._final_cache[0] != results:
+            score_text = self.menu_font.render(f"Final Score: {self.score}", True, (255, 255, 255))
+            wave_text = self.menu_font.render(f"Waves Survived: {self.wave}", True, (255, 255, 255))
+            self._final_cache = (results, (
+                (score_text, score_text.get_rect(midtop=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))),
+                (wave_text, wave_text.get_rect(midtop=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50)))
+            ))
         
         # Draw game over text
-        game_over = self.title_font.render("GAME OVER", True, (255, 0, 0))
-        score_text = self.menu_font.render(f"Final Score: {self.score}", True, (255, 255, 255))
-        wave_text = self.menu_font.render(f"Waves Survived: {self.wave}", True, (255, 255, 255))
-        restart_text = self.menu_font.render("Press ENTER to Return to Menu", True, (255, 255, 255))
-        
-        self.screen.blit(
-            game_over,
-            (SCREEN_WIDTH//2 - game_over.get_width()//2, SCREEN_HEIGHT//3)
-        )
-        self.screen.blit(
-            score_text,
-            (SCREEN_WIDTH//2 - score_text.get_width()//2, SCREEN_HEIGHT//2)
-        )
-        self.screen.blit(
-            wave_text,
-            (SCREEN_WIDTH//2 - wave_text.get_width()//2, SCREEN_HEIGHT//2 + 50)
-        )
-        self.screen.blit(
-            restart_text,
-            (SCREEN_WIDTH//2 - restart_text.get_width()//2, SCREEN_HEIGHT//2 + 100)
-        )
+        self.screen.blit(self.game_over_text, self.game_over_rect)
+        self.screen.blits(self._final_cache[1], doreturn=False)
+        self.screen.blit(self.restart_text, self.restart_rect)
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         """Draw the current game state."""
         if self.state == GameState.MENU:
             self.draw_menu()
         elif self.state == GameState.PLAYING:
-            self.draw_game()
+            self.draw_game(alpha)
         elif self.state == GameState.PAUSED:
-            self.draw_game()
+            # The simulation is frozen, so draw sprites at their latest position
+            self.draw_game(1.0)
             self.draw_pause()
         elif self.state == GameState.GAME_OVER:
-            self.draw_game()
+            self.draw_game(1.0)
             self.draw_game_over()
         
         pygame.display.flip()
@@ -699,20 +925,38 @@ class Game:
         """Handle game over state."""
         self.state = GameState.GAME_OVER
     
-    def run(self):
-        """Main game loop."""
+    async def run(self):
+        """Main game loop.
+        
+        Frames are paced with asyncio.sleep instead of clock.tick, so other
+        tasks (and browser builds) get to run between frames.
+        """
+        frame_time = 1.0 / FPS
+        accumulator = 0.0
+        last = time.monotonic()
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_start = time.monotonic()
+            accumulator += min(frame_start - last, MAX_FRAME_TIME)
+            last = frame_start
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            self.keys = pygame.key.get_pressed()
+            
+            # Advance the simulation in fixed steps
+            while accumulator >= FIXED_DT:
+                self.update(FIXED_DT)
+                accumulator -= FIXED_DT
+            
+            self.draw(accumulator / FIXED_DT)
+            
+            # Sleep off the rest of the frame
+            await asyncio.sleep(max(0.0, frame_time - (time.monotonic() - frame_start)))
         
         pygame.quit()
 
 def run_game():
     """Entry point for the game."""
     game = Game()
-    game.run()
+    asyncio.run(game.run())
 
 if __name__ == "__main__":
     run_game()
@@ -6,16 +6,17 @@ Main entry point for the arcade games collection.
 import pygame
 import sys
 import os
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, BLUE, GRAY, GAME_MODULES
-from utils.ui_elements import Button, Menu
-from utils.audio_manager import AudioManager
-from utils.helper import create_screen, load_game_module
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, BLUE, GRAY, GAME_MODULES
+from .utils.ui_elements import Button, Menu
+from .utils.audio_manager import AudioManager, pre_init_mixer
+from .utils.helper import create_screen, load_game_module
 
 class GameLauncher:
     """Main launcher for the arcade games."""
     
     def __init__(self):
         # Initialize pygame
+        pre_init_mixer()
         pygame.init()
         pygame.display.set_caption("Arcade Games Launcher")
         
@@ -4,17 +4,17 @@ Ensures proper pygame initialization.
 """
 
 import pygame
-import sys
-import os
+
+from .utils.audio_manager import pre_init_mixer
 
 def main():
     """Run the Pixel Heist game."""
     # Initialize pygame
+    pre_init_mixer()
     pygame.init()
     
     # Import the game module
-    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from games.pixel_heist.main import run_game
+    from .games.pixel_heist.main import run_game
     
     # Run the game
     run_game()
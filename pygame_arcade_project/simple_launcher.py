@@ -5,27 +5,30 @@ A basic launcher for the arcade games collection.
 
 import pygame
 import sys
-import os
 import importlib
 
-# Add the project root directory to the Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT
+from .utils.helper import wait_for_events, restore_screen, filter_menu_events
+from .utils.fonts import get_sysfont
+from .utils.audio_manager import pre_init_mixer
 
 # Game modules to load
 GAMES = {
     "Rocket Rumble": {
-        "module": "games.rocket_rumble.main",
+        "module": ".games.rocket_rumble.main",
         "function": "run_game",
         "color": (0, 255, 255)  # Cyan
     },
     "Pixel Heist": {
-        "module": "games.pixel_heist.main",
+        "module": ".games.pixel_heist.main",
         "function": "run_game",
         "color": (0, 255, 0)  # Green
     }
 }
 
+# Button outline color
+BUTTON_BORDER_COLOR = (255, 255, 255)
+
 class Button:
     """A simple button class."""
     
@@ -33,36 +36,52 @@ class Button:
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.color = color
+        self._hover_bg = tuple(min(c + 30, 255) for c in color)
         self.hover = False
-        self.font = pygame.font.SysFont("Arial", 24)
+        self._last_hover = None  # Hover state last drawn
+        self.font = get_sysfont("Arial", 24)
+        
+        # Render the label once; it never changes
+        self.text_surf = self.font.render(self.text, True, (255, 255, 255))
+        self.text_rect = self.text_surf.get_rect(center=self.rect.center)
     
     def update(self, mouse_pos):
-        """Update button state."""
-        self.hover = self.rect.collidepoint(mouse_pos)
-        return self.hover
+        """Update button state; return True when the hover state changed."""
+        hover = bool(self.rect.collidepoint(mouse_pos))
+        changed = hover != self.hover
+        self.hover = hover
+        return changed
     
-    def draw(self, surface):
-        """Draw the button."""
+    def draw(self, surface, force=False):
+        """Draw the button if its look changed; return the painted area or None."""
+        if self.hover == self._last_hover and not force:
+            return None
+        self._last_hover = self.hover
+        
         # Draw button background
-        color = tuple(min(c + 30, 255) for c in self.color) if self.hover else self.color
+        color = self._hover_bg if self.hover else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, (255, 255, 255), self.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, BUTTON_BORDER_COLOR, self.rect, 2, border_radius=8)
         
         # Draw button text
-        text_surf = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        surface.blit(self.text_surf, self.text_rect)
+        
+        return self.rect
 
 class SimpleLauncher:
     """Simple launcher for the arcade games."""
     
     def __init__(self):
         # Initialize pygame
+        pre_init_mixer()
         pygame.init()
         pygame.display.set_caption("Arcade Games Launcher")
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+        filter_menu_events()
         self.running = True
+        self.mouse_pos = pygame.mouse.get_pos()  # Kept current from MOUSEMOTION events
+        self.needs_redraw = True
+        self.background = None  # Screen without buttons, captured by draw()
         
         # Create buttons
         self.buttons = []
@@ -88,20 +107,28 @@ class SimpleLauncher:
         )
         self.buttons.append(exit_button)
         
-        # Load fonts
-        self.title_font = pygame.font.SysFont("Arial", 48)
+        # Load fonts and render the title once
+        self.title_font = get_sysfont("Arial", 48)
+        self.title_surf = self.title_font.render("ARCADE GAMES", True, (255, 255, 255))
+        self.title_rect = self.title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
     
-    def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
+    def handle_events(self, events):
+        """Handle a batch of pygame events."""
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.needs_redraw = True
+            
+            elif event.type == pygame.MOUSEMOTION:
+                self.mouse_pos = event.pos
+            
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
-                    mouse_pos = pygame.mouse.get_pos()
+                    self.mouse_pos = event.pos
                     for i, button in enumerate(self.buttons):
-                        if button.rect.collidepoint(mouse_pos):
+                        if button.rect.collidepoint(event.pos):
                             if i == len(self.buttons) - 1:  # Exit button
                                 self.running = False
                             else:
@@ -110,27 +137,32 @@ class SimpleLauncher:
                                 self.launch_game(game_name)
     
     def update(self):
-        """Update launcher state."""
-        mouse_pos = pygame.mouse.get_pos()
-        for button in self.buttons:
-            button.update(mouse_pos)
+        """Update launcher state; return the buttons whose hover state changed."""
+        return [button for button in self.buttons if button.update(self.mouse_pos)]
     
     def draw(self):
         """Draw the launcher interface."""
         # Fill background
         self.screen.fill((20, 20, 40))
         
-        # Draw title
-        title_surf = self.title_font.render("ARCADE GAMES", True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        self.screen.blit(title_surf, title_rect)
+        # Draw title, keeping a copy of the background for partial repaints
+        self.screen.blit(self.title_surf, self.title_rect)
+        self.background = self.screen.copy()
         
         # Draw buttons
         for button in self.buttons:
-            button.draw(self.screen)
+            button.draw(self.screen, force=True)
         
         pygame.display.flip()
     
+    def draw_buttons(self, buttons):
+        """Repaint only the given buttons and present just their rects."""
+        dirty_rects = []
+        for button in buttons:
+            self.screen.blit(self.background, button.rect, button.rect)
+            dirty_rects.append(button.draw(self.screen))
+        pygame.display.update(dirty_rects)
+    
     def launch_game(self, game_name):
         """Launch the selected game."""
         if game_name in GAMES:
@@ -138,34 +170,37 @@ class SimpleLauncher:
             
             try:
                 # Import the game module
-                game_module = importlib.import_module(game_info["module"])
+                game_module = importlib.import_module(game_info["module"], __package__)
                 
                 # Get the run function
                 run_func = getattr(game_module, game_info["function"])
                 
-                # Run the game
+                # Run the game with its full event set
+                filter_menu_events(False)
                 run_func()
                 
-                # Reset display for launcher
-                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                pygame.display.set_caption("Arcade Games Launcher")
-                
             except Exception as e:
                 print(f"Error launching game {game_name}: {e}")
+            
+            # Reset display for launcher, even if the game failed
+            self.screen = restore_screen("Arcade Games Launcher")
+            filter_menu_events()
+            self.needs_redraw = True
     
     def run(self):
-        """Main launcher loop."""
-        # Initialize pygame
-        pygame.init()
-        pygame.display.set_caption("Arcade Games Launcher")
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+        """Main launcher loop.
         
+        The menu is static, so the loop sleeps until input arrives and only
+        redraws when something on screen changed.
+        """
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            self.handle_events(wait_for_events())
+            changed = self.update()
+            if self.needs_redraw:
+                self.draw()
+                self.needs_redraw = False
+            elif changed:
+                self.draw_buttons(changed)
         
         pygame.quit()
         sys.exit()
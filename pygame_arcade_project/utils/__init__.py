@@ -3,3 +3,6 @@
 from . import ui_elements
 from . import audio_manager
 from . import helper
+from . import spatial_hash
+from . import fonts
+from . import trig
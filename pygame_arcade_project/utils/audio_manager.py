@@ -2,11 +2,32 @@
 
 import pygame
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the project root directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import SOUNDS_DIR
+from ..config import SOUNDS_DIR, MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER
+
+# File extensions loaded as sound effects
+SOUND_EXTENSIONS = {'.wav', '.mp3', '.ogg'}
+
+# Upper bound on threads used to decode a sound directory
+MAX_LOAD_WORKERS = 8
+
+def pre_init_mixer():
+    """Set the mixer format; call before pygame.init() so assets play unresampled."""
+    pygame.mixer.pre_init(
+        frequency=MIXER_FREQUENCY,
+        size=MIXER_SIZE,
+        channels=MIXER_CHANNELS,
+        buffer=MIXER_BUFFER
+    )
+
+def _decode_sound(name_and_path):
+    """Decode one sound file; runs in a worker thread."""
+    name, file_path = name_and_path
+    try:
+        return name, pygame.mixer.Sound(file_path), None
+    except Exception as e:
+        return name, None, e
 
 class AudioManager:
     """Manages audio playback for the games."""
@@ -15,7 +36,10 @@ class AudioManager:
         self.sounds = {}
         self.music_file = None
         self.volume = 0.5
-        pygame.mixer.init()
+        
+        # Reuse the mixer pygame.init() already opened with the pre_init settings
+        if pygame.mixer.get_init() is None:
+            pygame.mixer.init()
     
     def load_sound(self, name, file_path):
         """Load a sound effect."""
@@ -34,11 +58,29 @@ class AudioManager:
             print(f"Sound directory not found: {directory}")
             return
             
-        for filename in os.listdir(directory):
-            if filename.endswith(('.wav', '.mp3', '.ogg')):
-                name = os.path.splitext(filename)[0]
-                file_path = os.path.join(directory, filename)
-                self.load_sound(name, file_path)
+        # One scandir pass; DirEntry caches the file type and full path
+        sound_files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                name, ext = os.path.splitext(entry.name)
+                if ext.lower() in SOUND_EXTENSIONS:
+                    sound_files.append((name, entry.path))
+        
+        if not sound_files:
+            return
+        
+        # Decode in parallel (pygame releases the GIL while decoding), but
+        # only set volumes and fill self.sounds on this thread
+        workers = min(MAX_LOAD_WORKERS, os.cpu_count() or 1, len(sound_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for name, sound, error in executor.map(_decode_sound, sound_files):
+                if error is not None:
+                    print(f"Error loading sound {name}: {error}")
+                    continue
+                sound.set_volume(self.volume)
+                self.sounds[name] = sound
     
     def play_sound(self, name):
         """Play a sound effect."""
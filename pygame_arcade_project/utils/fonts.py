@@ -0,0 +1,19 @@
+"""Font cache shared by the launchers and games."""
+
+import functools
+import pygame
+
+@functools.lru_cache(maxsize=32)
+def get_sysfont(name, size):
+    """Return a system font, creating it only once per name and size."""
+    if get_sysfont.cache_info().currsize == 0:
+        # Fonts are freed by pygame.quit(), so forget them then as well
+        pygame.register_quit(get_sysfont.cache_clear)
+    return pygame.font.SysFont(name, size)
+
+@functools.lru_cache(maxsize=32)
+def get_font(path, size):
+    """Return a font loaded from a file, creating it only once per path and size."""
+    if get_font.cache_info().currsize == 0:
+        pygame.register_quit(get_font.cache_clear)
+    return pygame.font.Font(path, size)
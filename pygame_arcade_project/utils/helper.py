@@ -1,21 +1,66 @@
 """Helper functions for the arcade games."""
 
 import pygame
-import os
-import sys
+import functools
 import importlib
 
-# Add the project root directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# How long an idle menu sleeps in pygame.event.wait before looping (ms)
+EVENT_WAIT_TIMEOUT = 100
 
 def create_screen(width=SCREEN_WIDTH, height=SCREEN_HEIGHT, fullscreen=False):
     """Create a pygame display surface."""
     flags = pygame.FULLSCREEN if fullscreen else 0
     return pygame.display.set_mode((width, height), flags)
 
-def load_image(file_path, scale=None, alpha=False):
-    """Load an image from file path."""
+def restore_screen(caption, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """Get the display back after a game has run.
+    
+    Games may shut pygame down on exit; pygame is only re-initialised and the
+    window only recreated when that actually happened or the size changed.
+    """
+    if not pygame.display.get_init():
+        pygame.init()
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (width, height):
+        screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption(caption)
+    return screen
+
+def load_image(file_path, scale=None, alpha=False, smooth=True):
+    """Load an image from file path.
+    
+    Scaling uses smoothscale; pass smooth=False for pixel art that should
+    keep hard edges. Images are cached per (file_path, scale, alpha, smooth)
+    and the same Surface is returned on every call, so don't draw on it;
+    use load_image_copy for a surface of your own.
+    """
+    if isinstance(scale, list):
+        scale = tuple(scale)
+    return _load_image_cached(file_path, scale, alpha, smooth)
+
+def load_image_copy(file_path, scale=None, alpha=False, smooth=True):
+    """Load an image from file path as a private copy that is safe to modify."""
+    return load_image(file_path, scale, alpha, smooth).copy()
+
+def convert_alpha(surface):
+    """Convert a surface to the display's alpha format once a display exists."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+def _resize(image, size, smooth):
+    """Resize an image, skipping the work when it already has that size."""
+    if size == image.get_size():
+        return image
+    if smooth:
+        return pygame.transform.smoothscale(image, size)
+    return pygame.transform.scale(image, size)
+
+@functools.lru_cache(maxsize=256)
+def _load_image_cached(file_path, scale, alpha, smooth):
+    """Load, convert and scale an image; cached by load_image."""
     try:
         if alpha:
             image = pygame.image.load(file_path).convert_alpha()
@@ -24,13 +69,14 @@ def load_image(file_path, scale=None, alpha=False):
         
         if scale:
             if isinstance(scale, tuple):
-                image = pygame.transform.scale(image, scale)
+                image = _resize(image, scale, smooth)
             else:
                 # Assume scale is a float representing a multiplier
                 size = image.get_size()
-                image = pygame.transform.scale(
+                image = _resize(
                     image, 
-                    (int(size[0] * scale), int(size[1] * scale))
+                    (int(size[0] * scale), int(size[1] * scale)),
+                    smooth
                 )
         return image
     except Exception as e:
@@ -44,13 +90,36 @@ def load_game_module(game_name):
     """Dynamically load a game module."""
     try:
         # Import the game's main module
-        module_path = f"games.{game_name}.main"
-        game_module = importlib.import_module(module_path, package="pygame_arcade_project")
+        module_path = f"..games.{game_name}.main"
+        game_module = importlib.import_module(module_path, package=__package__)
         return game_module
     except ImportError as e:
         print(f"Error importing game {game_name}: {e}")
         return None
 
+def wait_for_events(timeout=EVENT_WAIT_TIMEOUT):
+    """Sleep until an event arrives or the timeout passes, then drain the queue."""
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+# Event types the launcher menus react to; SDL drops the rest before Python sees them
+MENU_EVENTS = [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+               pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+
+def filter_menu_events(enabled=True):
+    """Queue only MENU_EVENTS, or every event again when enabled is False.
+    
+    Games run inside a launcher need their full input, so the filter has to
+    be lifted before one starts and reapplied once the menu is back.
+    """
+    if enabled:
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(MENU_EVENTS)
+    else:
+        pygame.event.set_allowed(None)
+
 def center_rect(width, height, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
     """Return a centered rectangle."""
     return pygame.Rect(
@@ -60,21 +129,29 @@ def center_rect(width, height, screen_width=SCREEN_WIDTH, screen_height=SCREEN_H
         height
     )
 
+# Rect attributes draw_text can anchor the text by
+_TEXT_ALIGNS = frozenset(("center", "topleft", "topright", "bottomleft", "bottomright"))
+
+@functools.lru_cache(maxsize=128)
+def _render_text(text, font, color):
+    """Render text once per string, font and color; HUD text rarely changes."""
+    if _render_text.cache_info().currsize == 0:
+        # Rendered surfaces belong to the fonts freed by pygame.quit()
+        pygame.register_quit(_render_text.cache_clear)
+    return font.render(text, True, color)
+
 def draw_text(surface, text, font, color, x, y, align="center"):
     """Draw text on a surface with alignment options."""
-    text_surface = font.render(text, True, color)
-    text_rect = text_surface.get_rect()
+    try:
+        text_surface = _render_text(text, font, color)
+    except TypeError:
+        # Unhashable colors such as pygame.Color skip the cache
+        text_surface = font.render(text, True, color)
     
-    if align == "center":
-        text_rect.center = (x, y)
-    elif align == "topleft":
-        text_rect.topleft = (x, y)
-    elif align == "topright":
-        text_rect.topright = (x, y)
-    elif align == "bottomleft":
-        text_rect.bottomleft = (x, y)
-    elif align == "bottomright":
-        text_rect.bottomright = (x, y)
+    if align in _TEXT_ALIGNS:
+        text_rect = text_surface.get_rect(**{align: (x, y)})
+    else:
+        text_rect = text_surface.get_rect()
     
     surface.blit(text_surface, text_rect)
     return text_rect
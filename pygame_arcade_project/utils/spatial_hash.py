@@ -0,0 +1,42 @@
+"""Spatial hash grid for broad-phase collision checks."""
+
+
+class SpatialHashGrid:
+    """Uniform grid that buckets items by the cells their bounding box covers."""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> list of items
+
+    def clear(self):
+        """Remove all items, keeping the grid itself for reuse."""
+        self.cells.clear()
+
+    def _cell_range(self, x1, y1, x2, y2):
+        """Return the inclusive cell bounds covered by a bounding box."""
+        size = self.cell_size
+        return int(x1 // size), int(y1 // size), int(x2 // size), int(y2 // size)
+
+    def insert(self, item, x1, y1, x2, y2):
+        """Insert an item into every cell its bounding box touches."""
+        cells = self.cells
+        cx1, cy1, cx2, cy2 = self._cell_range(x1, y1, x2, y2)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def query(self, x1, y1, x2, y2):
+        """Return the set of items sharing a cell with the bounding box."""
+        cells = self.cells
+        found = set()
+        cx1, cy1, cx2, cy2 = self._cell_range(x1, y1, x2, y2)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
@@ -0,0 +1,15 @@
+"""Sine/cosine lookup tables shared by the games."""
+
+import math
+from array import array
+
+# Tables indexed by angle in 1/LUT_SIZE-ths of a turn
+LUT_SIZE = 1024
+LUT_MASK = LUT_SIZE - 1
+SIN = array('f', [math.sin(2 * math.pi * i / LUT_SIZE) for i in range(LUT_SIZE)])
+COS = array('f', [math.cos(2 * math.pi * i / LUT_SIZE) for i in range(LUT_SIZE)])
+
+def cos_sin(degrees):
+    """Look up (cos, sin) for an angle in degrees."""
+    i = int(degrees * (LUT_SIZE / 360)) & LUT_MASK
+    return COS[i], SIN[i]
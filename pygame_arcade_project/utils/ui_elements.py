@@ -2,11 +2,9 @@
 
 import pygame
 import os
-import sys
 
-# Add the project root directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import FONTS_DIR, WHITE, BLACK, GRAY, BLUE
+from ..config import FONTS_DIR, WHITE, BLACK, GRAY, BLUE
+from .fonts import get_font, get_sysfont
 
 class Button:
     """A simple button class for UI interactions."""
@@ -20,16 +18,17 @@ class Button:
         self.bg_color = bg_color
         self.hover_color = hover_color or tuple(max(0, c - 30) for c in bg_color)
         self.is_hovered = False
+        self._text_cache = (None, None)  # ((text, color), rendered surface)
         
         # Try to load a default font
         try:
             font_path = os.path.join(FONTS_DIR, "default.ttf")
             if os.path.exists(font_path):
-                self.font = pygame.font.Font(font_path, font_size)
+                self.font = get_font(font_path, font_size)
             else:
-                self.font = pygame.font.SysFont("Arial", font_size)
+                self.font = get_sysfont("Arial", font_size)
         except:
-            self.font = pygame.font.SysFont("Arial", font_size)
+            self.font = get_sysfont("Arial", font_size)
     
     def draw(self, surface):
         """Draw the button on the given surface."""
@@ -37,7 +36,11 @@ class Button:
         pygame.draw.rect(surface, color, self.rect)
         pygame.draw.rect(surface, BLACK, self.rect, 2)  # Border
         
-        text_surf = self.font.render(self.text, True, self.text_color)
+        # Re-render the label only when its text or color changes
+        key = (self.text, self.text_color)
+        if self._text_cache[0] != key:
+            self._text_cache = (key, self.font.render(self.text, True, self.text_color))
+        text_surf = self._text_cache[1]
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
     
@@ -60,39 +63,61 @@ class Menu:
         self.height = height
         self.bg_color = bg_color
         self.buttons = []
+        self._rects = []  # Button rects, parallel to self.buttons
+        self._layout = (None, None)  # (inputs, (menu_rect, title_surf, title_rect))
         
         # Try to load a default font
         try:
             font_path = os.path.join(FONTS_DIR, "default.ttf")
             if os.path.exists(font_path):
-                self.title_font = pygame.font.Font(font_path, 48)
+                self.title_font = get_font(font_path, 48)
             else:
-                self.title_font = pygame.font.SysFont("Arial", 48)
+                self.title_font = get_sysfont("Arial", 48)
         except:
-            self.title_font = pygame.font.SysFont("Arial", 48)
+            self.title_font = get_sysfont("Arial", 48)
     
     def add_button(self, button):
         """Add a button to the menu."""
         self.buttons.append(button)
+        self._rects.append(button.rect)
+    
+    def update(self, mouse_pos):
+        """Set every button's hover state from one batched rect test."""
+        hovered = set(pygame.Rect(mouse_pos, (1, 1)).collidelistall(self._rects))
+        for i, button in enumerate(self.buttons):
+            button.is_hovered = i in hovered
+    
+    def _get_layout(self, surface):
+        """Return (menu_rect, title_surf, title_rect) for the surface size.
+        
+        Only recomputed when the surface is resized or the menu's title or
+        size changes.
+        """
+        key = (surface.get_size(), self.title, self.width, self.height)
+        if self._layout[0] != key:
+            sw, sh = key[0]
+            menu_rect = pygame.Rect(
+                (sw - self.width) // 2,
+                (sh - self.height) // 2,
+                self.width,
+                self.height
+            )
+            title_surf = self.title_font.render(self.title, True, WHITE)
+            title_rect = title_surf.get_rect(
+                center=(sw // 2, (sh - self.height) // 2 + 50)
+            )
+            self._layout = (key, (menu_rect, title_surf, title_rect))
+        return self._layout[1]
     
     def draw(self, surface):
         """Draw the menu on the given surface."""
+        menu_rect, title_surf, title_rect = self._get_layout(surface)
+        
         # Draw background
-        menu_rect = pygame.Rect(
-            (surface.get_width() - self.width) // 2,
-            (surface.get_height() - self.height) // 2,
-            self.width,
-            self.height
-        )
         pygame.draw.rect(surface, self.bg_color, menu_rect)
         pygame.draw.rect(surface, BLACK, menu_rect, 3)  # Border
         
         # Draw title
-        title_surf = self.title_font.render(self.title, True, WHITE)
-        title_rect = title_surf.get_rect(
-            center=(surface.get_width() // 2, 
-                   (surface.get_height() - self.height) // 2 + 50)
-        )
         surface.blit(title_surf, title_rect)
         
         # Draw buttons
@@ -102,12 +127,11 @@ class Menu:
     def handle_event(self, event):
         """Handle events for the menu."""
         if event.type == pygame.MOUSEMOTION:
-            for button in self.buttons:
-                button.check_hover(event.pos)
+            self.update(event.pos)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
-            for button in self.buttons:
-                if button.is_clicked(event.pos, True):
-                    return button.text
+            index = pygame.Rect(event.pos, (1, 1)).collidelist(self._rects)
+            if index != -1:
+                return self.buttons[index].text
         
         return None